@@ -2,61 +2,115 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
-from .api import WiiMClient
-from .const import DOMAIN, CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL
-from .coordinator import WiiMCoordinator
+from .const import (
+    DOMAIN,
+    DATA_COORDINATORS_BY_IP,
+    CONF_CACHED_DEVICE_NAME,
+    CONF_POLL_INTERVAL,
+    CONF_VOLUME_STEP,
+    DEFAULT_POLL_INTERVAL,
+    DEFAULT_VOLUME_STEP,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import WiiMCoordinator
 
 PLATFORMS = [Platform.MEDIA_PLAYER, Platform.SENSOR, Platform.BUTTON, Platform.NUMBER]
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up WiiM from a config entry."""
+    # Deferred so HA boot does not pay for the client/coordinator imports
+    # until an entry is actually being set up.
+    from .api import WiiMClient
+    from .coordinator import WiiMCoordinator
+
     # Re-use Home Assistant's global aiohttp session to avoid unclosed-session warnings.
     client = WiiMClient(entry.data["host"], session=async_get_clientsession(hass))
-    # Validate device is reachable; initial data will be fetched by coordinator
-    await client.get_status()
+    # Reachability is validated by the first refresh below, which raises
+    # ConfigEntryNotReady on failure – no separate pre-flight request needed.
     poll_interval = entry.options.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL)
     coordinator = WiiMCoordinator(hass, client, poll_interval=poll_interval)
     coordinator.entry_id = entry.entry_id  # type: ignore[attr-defined]
+    coordinator.volume_step = entry.options.get(CONF_VOLUME_STEP, DEFAULT_VOLUME_STEP)
 
-    hass.data.setdefault(DOMAIN, {})
-    hass.data[DOMAIN][entry.entry_id] = coordinator
+    # Platforms read the coordinator straight off the entry; the domain-wide
+    # registry is kept only for cross-device lookups (groups, slaves).
+    entry.runtime_data = coordinator
+    domain_data = hass.data.get(DOMAIN)
+    if domain_data is None:
+        domain_data = hass.data[DOMAIN] = {}
+    domain_data[entry.entry_id] = coordinator
+    hass.data.setdefault(DATA_COORDINATORS_BY_IP, {})[client.host] = coordinator
 
     await coordinator.async_config_entry_first_refresh()
 
     # ------------------------------------------------------------------
-    # Update entry title to user-friendly device name on first setup
+    # Update entry title to user-friendly device name on first setup.  The
+    # resolved name is cached in entry.data so reloads skip this entirely;
+    # the coordinator drops the cache when the device is renamed.
     # ------------------------------------------------------------------
 
-    status = coordinator.data.get("status", {}) if isinstance(coordinator.data, dict) else {}
-    friendly_name = status.get("device_name") or status.get("DeviceName")
-    if friendly_name and friendly_name != entry.title:
-        hass.config_entries.async_update_entry(entry, title=friendly_name)
+    if not entry.data.get(CONF_CACHED_DEVICE_NAME):
+        status = coordinator.data.get("status", {})
+        friendly_name = status.get("device_name")
+        if friendly_name:
+            # Synchronous and cheap – the entry store write itself is
+            # already deferred by Home Assistant.
+            hass.config_entries.async_update_entry(
+                entry,
+                title=friendly_name,
+                data={**entry.data, CONF_CACHED_DEVICE_NAME: friendly_name},
+            )
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
+    # HA group membership is event driven rather than read on every poll
+    entry.async_on_unload(coordinator.async_track_ha_group())
+
+    # Apply option changes (e.g. poll interval) in place instead of reloading
+    entry.async_on_unload(entry.add_update_listener(_async_options_updated))
+
     # No need for explicit shutdown handler – HA will close the shared session.
 
     return True
 
 
+async def _async_options_updated(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Hot-apply a changed poll interval/volume step without reloading the entry."""
+    coordinator: WiiMCoordinator = entry.runtime_data
+    coordinator.volume_step = entry.options.get(CONF_VOLUME_STEP, DEFAULT_VOLUME_STEP)
+    coordinator.set_base_poll_interval(entry.options.get(CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL))
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        domain_data = hass.data[DOMAIN]
+        coordinator = domain_data[entry.entry_id]
+        # Cancel any scheduled/in-flight poll so it cannot run against the
+        # torn-down entry.  The client uses HA's shared aiohttp session, so
+        # there is nothing per-entry to close.
+        await coordinator.async_shutdown()
+        domain_data.pop(entry.entry_id)
+        by_ip = hass.data.get(DATA_COORDINATORS_BY_IP, {})
+        if by_ip.get(coordinator.client.host) is coordinator:
+            del by_ip[coordinator.client.host]
 
         # Clean up any dynamic WiiMGroupMediaPlayer entities whose master IP
         # belonged to the coordinator we just unloaded.  This avoids orphaned
         # entities lingering in the entity registry until the next coordinator
         # refresh.
-        group_entities = hass.data[DOMAIN].get("_group_entities", {})
+        group_entities = domain_data.get("_group_entities", {})
         # The host/IP of the device associated with this entry
         host = entry.data.get("host")
         if host and host in group_entities:
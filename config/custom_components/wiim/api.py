@@ -23,18 +23,27 @@ verification and request/response parsing.
 from __future__ import annotations
 
 import asyncio
+import binascii
+import functools
 import json
 import logging
+import time
 from http import HTTPStatus
 from typing import Any
 from urllib.parse import quote
 
 import aiohttp
-import async_timeout
 from aiohttp import ClientSession
 from aiohttp.client_exceptions import ClientError
 import ssl
 
+try:  # orjson ships with Home Assistant; fall back to stdlib elsewhere
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # pragma: no cover – exercised only outside HA
+    _json_loads = json.loads
+
 from .const import (
     API_ENDPOINT_CLEAR_PLAYLIST,
     API_ENDPOINT_DEVICE_INFO,
@@ -81,10 +90,16 @@ from .const import (
     API_ENDPOINT_EQ_OFF,
     API_ENDPOINT_EQ_STATUS,
     API_ENDPOINT_EQ_LIST,
+    API_ENDPOINT_PLAYER_STATUS,
+    API_ENDPOINT_PLAY_PROMPT_URL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Play modes accepted by the repeat / shuffle setters
+_REPEAT_MODES = frozenset({PLAY_MODE_NORMAL, PLAY_MODE_REPEAT_ALL, PLAY_MODE_REPEAT_ONE})
+_SHUFFLE_MODES = frozenset({PLAY_MODE_NORMAL, PLAY_MODE_SHUFFLE, PLAY_MODE_SHUFFLE_REPEAT_ALL})
+
 WIIM_CA_CERT = """-----BEGIN CERTIFICATE-----
 MIIDmDCCAoACAQEwDQYJKoZIhvcNAQELBQAwgZExCzAJBgNVBAYTAkNOMREwDwYD
 VQQIDAhTaGFuZ2hhaTERMA8GA1UEBwwIU2hhbmdoYWkxETAPBgNVBAoMCExpbmtw
@@ -108,7 +123,101 @@ wi2B2GovofQ/4icVZ3ecTqYK3q9gEtJi72V+dVHM9kSA4Upy28Y0U1v56uoqeWQ6
 uc2m8y8O/hXPSfKd
 -----END CERTIFICATE-----"""
 
-HEADERS = {"Connection": "close"}
+# Connection tuning for the client-owned fallback session.  Keep-alive lets
+# consecutive polls reuse the TCP/TLS connection instead of re-handshaking.
+_CONNECTOR_LIMIT_PER_HOST = 4
+_KEEPALIVE_TIMEOUT = 75
+# Discovery often yields hostnames; cache their resolution across requests.
+_DNS_CACHE_TTL = 300
+# Upper bound for the TCP port race in WiiMClient._probe_port (seconds).
+_PORT_PROBE_TIMEOUT = 3
+# A speaker on the LAN accepts a TCP connection within a few ms; anything
+# slower means it is offline, so fail the connect phase fast instead of
+# waiting out the whole request deadline.
+_CONNECT_TIMEOUT = 1.0
+# LinkPlay modules are low-powered and start refusing connections when
+# flooded (e.g. at HA startup or right after a reboot).  Cap concurrent
+# requests per client.  The value is not a measured device limit: it is the
+# number of requests one poll issues in parallel (player status / meta,
+# getStatusEx, multiroom), so a poll is never serialised and commands queue
+# behind it.
+_MAX_CONCURRENT_REQUESTS_PER_HOST = 3
+
+
+@functools.lru_cache(maxsize=1)
+def _shared_ssl_context() -> ssl.SSLContext:
+    """Return the TLS client context shared by every :class:`WiiMClient`.
+
+    Home Assistant considers `ssl.create_default_context()` a blocking
+    operation because it tries to load the system trust store from disk.
+    To stay fully async-safe we instead create a bare `SSLContext` and
+    explicitly load **only** the pinned WiiM root certificate. If loading
+    the certificate fails for any reason (e.g. corrupted PEM), we fall
+    back to an *unverified* context so the request code can still proceed.
+
+    The context is never mutated after creation, so one instance (and one
+    PEM parse) serves all devices.
+    """
+    # Start with a minimal TLS client context (no file-system access)
+    ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
+    ctx.check_hostname = False  # Device uses self-signed cert with host-mismatch
+    ctx.verify_mode = ssl.CERT_NONE  # Don't verify cert since it's self-signed
+
+    try:
+        # Load the WiiM CA certificate for reference
+        ctx.load_verify_locations(cadata=WIIM_CA_CERT)
+        _LOGGER.debug("Successfully loaded WiiM CA certificate")
+    except Exception as e:
+        _LOGGER.warning(
+            "Failed to load WiiM CA certificate: %s. This may indicate a device with a self-signed certificate.",
+            e
+        )
+
+    return ctx
+
+
+# Normalisation table for the *player-status* endpoint.  Keys on the left
+# are raw HTTP-API field names, values are our canonical attribute names
+# used throughout the integration.
+_STATUS_MAP: dict[str, str] = {
+    "status": "play_status",
+    "vol": "volume",
+    "mute": "mute",
+    "eq": "eq_preset",
+    "EQ": "eq_preset",        # Some firmwares use upper-case EQ
+    "eq_mode": "eq_preset",   # Seen on recent builds (e.g. W281)
+    "loop": "loop_mode",
+    "curpos": "position_ms",
+    "totlen": "duration_ms",
+    "Title": "title_hex",
+    "Artist": "artist_hex",
+    "Album": "album_hex",
+    "DeviceName": "device_name",
+    # Wi-Fi (only present in fallback)
+    "WifiChannel": "wifi_channel",
+    "RSSI": "wifi_rssi",
+}
+
+
+# Artwork URL field names seen across vendors/firmwares, in priority order.
+_COVER_KEYS: tuple[str, ...] = (
+    "cover",
+    "cover_url",
+    "albumart",
+    "albumArtURI",
+    "albumArtUri",
+    "albumarturi",
+    "art_url",
+    "artwork_url",
+    "pic_url",
+)
+
+
+# On/off command URLs indexed by ``bool`` – built once instead of formatted
+# on every toggle.
+_MUTE_URLS = (f"{API_ENDPOINT_MUTE}0", f"{API_ENDPOINT_MUTE}1")
+_POWER_URLS = (f"{API_ENDPOINT_POWER}0", f"{API_ENDPOINT_POWER}1")
+_LED_URLS = (f"{API_ENDPOINT_LED}0", f"{API_ENDPOINT_LED}1")
 
 
 class WiiMError(Exception):
@@ -188,6 +297,7 @@ class WiiMClient:
         timeout: float = DEFAULT_TIMEOUT,
         ssl_context: ssl.SSLContext | None = None,
         session: ClientSession | None = None,
+        connector: aiohttp.BaseConnector | None = None,
     ) -> None:
         """Initialize the WiiM client.
 
@@ -197,16 +307,30 @@ class WiiMClient:
             timeout: Request timeout in seconds (default: 10.0).
             ssl_context: SSL context for HTTPS connections.
             session: Optional aiohttp ClientSession to use for requests.
+            connector: Optional connector shared between clients; only used
+                when no *session* is given, and never closed by this client.
         """
         self._host = host
         self.port = port
         self.timeout = timeout
+        # aiohttp enforces this per request; no extra asyncio timer needed
+        self._client_timeout = aiohttp.ClientTimeout(
+            total=timeout, connect=min(_CONNECT_TIMEOUT, timeout), sock_read=timeout
+        )
         self.ssl_context = ssl_context
         self._session = session
+        # Only sessions we create ourselves are closed in close(); an injected
+        # session (normally Home Assistant's shared one) is left alone.
+        self._owns_session = session is None
+        self._connector = connector
         # Choose scheme based on port (80 = http, everything else = https)
         scheme = "http" if port == 80 else "https"
         self._endpoint = f"{scheme}://{host}:{port}"
-        self._lock = asyncio.Lock()
+        # URL prefixes for every port _request may use, built once so the hot
+        # path only concatenates the endpoint.
+        self._url_prefix_by_port: dict[int, str] = {
+            p: f"{'http' if p == 80 else 'https'}://{host}:{p}" for p in {port, 80}
+        }
         self._base_url = self._endpoint
         self._group_master: str | None = None
         self._group_slaves: list[str] = []
@@ -215,6 +339,15 @@ class WiiMClient:
         # *insecure* mode after the first verification failure to avoid the
         # noisy SSL errors on every poll.
         self._verify_ssl_default: bool = True
+        # Port that answered last time.  Once learned, requests go straight to
+        # it and the port probe only re-runs after it stops responding.
+        self._working_port: int | None = None
+        self._request_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS_PER_HOST)
+        # Static identity data – fetched once, cleared on reboot (the only
+        # way a firmware upgrade takes effect).
+        self._device_info: dict[str, Any] | None = None
+        self._firmware_version: str | None = None
+        self._mac_address: str | None = None
 
     @property
     def host(self) -> str:
@@ -222,37 +355,48 @@ class WiiMClient:
         return self._host
 
     def _get_ssl_context(self) -> ssl.SSLContext:
-        """Return (and lazily create) the SSL context.
-
-        Home Assistant considers `ssl.create_default_context()` a blocking
-        operation because it tries to load the system trust store from disk.
-        To stay fully async-safe we instead create a bare `SSLContext` and
-        explicitly load **only** the pinned WiiM root certificate. If loading
-        the certificate fails for any reason (e.g. corrupted PEM), we fall
-        back to an *unverified* context so the request code can still proceed
-        and rely on the existing retry-with-insecure logic.
+        """Return the SSL context for requests.
+
+        An explicitly supplied context wins; otherwise all clients share the
+        module-level context from :func:`_shared_ssl_context`.
         """
         if self.ssl_context is not None:
             return self.ssl_context
+        return _shared_ssl_context()
 
-        # Start with a minimal TLS client context (no file-system access)
-        ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_CLIENT)
-        ctx.check_hostname = False  # Device uses self-signed cert with host-mismatch
-        ctx.verify_mode = ssl.CERT_NONE  # Don't verify cert since it's self-signed
+    async def _probe_port(self) -> int | None:
+        """Find a port that accepts TCP connections, preferring the configured one.
 
-        try:
-            # Load the WiiM CA certificate for reference
-            ctx.load_verify_locations(cadata=WIIM_CA_CERT)
-            _LOGGER.debug("Successfully loaded WiiM CA certificate for %s", self.host)
-        except Exception as e:
-            _LOGGER.warning(
-                "Failed to load WiiM CA certificate for %s: %s. This may indicate a device with a self-signed certificate.",
-                self.host,
-                e
-            )
+        The configured port and the port-80 fallback are connected to
+        concurrently, but the configured port wins whenever it answers within
+        ``_PORT_PROBE_TIMEOUT`` – a speaker serving both never drops to plain
+        HTTP.  Returns ``None`` if no port accepts a connection.  A TCP
+        connect costs one RTT whereas a failed HTTPS attempt costs a full
+        handshake (or timeout).
+        """
 
-        self.ssl_context = ctx
-        return self.ssl_context
+        async def _connect(port: int) -> int:
+            _reader, writer = await asyncio.open_connection(self._host, port)
+            writer.close()
+            await writer.wait_closed()
+            return port
+
+        # Preference order: configured port first, then the fallback
+        ports = [self.port, *(p for p in self._url_prefix_by_port if p != self.port)]
+        tasks = [asyncio.create_task(_connect(port)) for port in ports]
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + _PORT_PROBE_TIMEOUT
+        try:
+            for task in tasks:
+                try:
+                    return await asyncio.wait_for(asyncio.shield(task), max(0, deadline - loop.time()))
+                except (OSError, asyncio.TimeoutError):
+                    continue
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+        return None
 
     async def _request(
         self,
@@ -275,54 +419,75 @@ class WiiMClient:
             WiiMResponseError: If the device returns an error response.
         """
         if self._session is None:
-            # aiohttp>=3.9 requires a ClientTimeout object
-            timeout_obj = aiohttp.ClientTimeout(total=self.timeout)
-            self._session = aiohttp.ClientSession(timeout=timeout_obj)
-
-        kwargs.setdefault("headers", HEADERS)
-        kwargs.setdefault("ssl", self._get_ssl_context())
-
-        # Try both ports (443 and 80) with and without SSL verification
-        ports_to_try = [(self.port, False), (80, False)]  # Always use unverified SSL
-        tried: list[str] = []
-        last_error: Exception | None = None
+            connector = self._connector or aiohttp.TCPConnector(
+                limit_per_host=_CONNECTOR_LIMIT_PER_HOST,
+                keepalive_timeout=_KEEPALIVE_TIMEOUT,
+                ttl_dns_cache=_DNS_CACHE_TTL,
+            )
+            self._session = aiohttp.ClientSession(
+                connector=connector, connector_owner=self._connector is None
+            )
+            self._owns_session = True
+
+        # Per-request options, built once for all port attempts; caller
+        # supplied kwargs take precedence.
+        req_kwargs = {"ssl": self._get_ssl_context(), "timeout": self._client_timeout, **kwargs}
+
+        # Learn the port with a cheap TCP probe first.  If nothing accepts a
+        # connection the device is unreachable – fail without paying for
+        # full HTTP attempts.
+        if self._working_port is None and len(self._url_prefix_by_port) > 1:
+            self._working_port = await self._probe_port()
+            if self._working_port is None:
+                raise WiiMConnectionError(
+                    f"Failed to connect to WiiM device: no port of {self.host} accepts connections"
+                )
 
-        for port, verify_ssl in ports_to_try:
-            url = f"https://{self.host}:{port}{endpoint}"
-            tried.append(f"{url} (verify={verify_ssl})")
+        # Only the configured port is known when there is nothing to probe
+        # (port 80 configured).  SSL verification is always off (self-signed).
+        port = self._working_port or self.port
+        url = self._url_prefix_by_port[port] + endpoint
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
 
-            try:
+        try:
+            if debug:
                 _LOGGER.debug("Making request to %s", url)
-                async with async_timeout.timeout(self.timeout):
-                    async with self._session.request(method, url, **kwargs) as response:
-                        response.raise_for_status()
-                        text = await response.text()
-                        _LOGGER.debug("Response from %s: %s", url, text)
-                        if text.strip() == "OK":
-                            return {"raw": text.strip()}
-                        return json.loads(text)
-            except (aiohttp.ClientError, asyncio.TimeoutError) as err:
-                last_error = err
-                _LOGGER.debug(
-                    "Connection error for %s: %s. Will try next configuration.",
-                    url,
-                    err
-                )
-                if verify_ssl:
-                    continue
-                raise WiiMConnectionError(f"Failed to connect to WiiM device: {err}") from err
-            except json.JSONDecodeError:
-                # Most control endpoints return plain "OK". Treat any
-                # non-JSON body as a successful raw response instead of an
-                # error so caller logic doesn't break on a volume/power/etc.
-                _LOGGER.debug("Non-JSON response from %s: %s", url, text)
-                return {"raw": text.strip()}
-
-        # If we get here, all attempts failed
-        error_msg = f"Failed to communicate with WiiM device after trying: {', '.join(tried)}"
-        if last_error:
-            error_msg += f"\nLast error: {last_error}"
-        raise WiiMRequestError(error_msg)
+            async with self._request_semaphore, self._session.request(method, url, **req_kwargs) as response:
+                response.raise_for_status()
+                body = await response.read()
+                self._working_port = port
+                if debug:
+                    _LOGGER.debug("Response from %s: %s", url, body)
+                # Sniff the first byte: JSON goes straight to the parser,
+                # anything else ("OK", plain text) is returned raw.  Only
+                # bodies with leading whitespace pay for an lstrip().
+                first = body[:1]
+                if first and first in b" \t\r\n":
+                    first = body.lstrip()[:1]
+                if first in (b"{", b"["):
+                    return _json_loads(body)
+                return {"raw": body.decode("utf-8", errors="replace").strip()}
+        except (
+            aiohttp.ClientConnectorError,
+            aiohttp.ServerDisconnectedError,
+            asyncio.TimeoutError,
+        ) as err:
+            # The port stopped answering – forget it so the next call
+            # re-probes, but fail this one fast.
+            self._working_port = None
+            raise WiiMConnectionError(f"Failed to connect to WiiM device at {url}: {err}") from err
+        except aiohttp.ClientError as err:
+            # HTTP-level failure (e.g. 404 for an unsupported endpoint) – the
+            # device is reachable, so keep the learned port.
+            raise WiiMRequestError(f"Request to {url} failed: {err}") from err
+        except ValueError:
+            # Body looked like JSON but did not parse.  Treat it as a
+            # successful raw response instead of an error so caller
+            # logic doesn't break on a volume/power/etc.
+            # (both json and orjson decode errors subclass ValueError)
+            text = body.decode("utf-8", errors="replace").strip()
+            _LOGGER.debug("Non-JSON response from %s: %s", url, text)
+            return {"raw": text}
 
     async def close(self) -> None:
         """Close the client session.
@@ -330,9 +495,9 @@ class WiiMClient:
         This should be called when the client is no longer needed to properly
         clean up resources.
         """
-        if self._session:
+        if self._session and self._owns_session:
             await self._session.close()
-            self._session = None
+        self._session = None
 
     async def get_status(self) -> dict[str, Any]:
         """Get the current status of the WiiM device.
@@ -395,7 +560,7 @@ class WiiMClient:
         Args:
             mute: True to mute, False to unmute.
         """
-        await self._request(f"{API_ENDPOINT_MUTE}{1 if mute else 0}")
+        await self._request(_MUTE_URLS[bool(mute)])
 
     async def set_power(self, power: bool) -> None:
         """Set the power state.
@@ -403,7 +568,7 @@ class WiiMClient:
         Args:
             power: True to turn on, False to turn off.
         """
-        await self._request(f"{API_ENDPOINT_POWER}{1 if power else 0}")
+        await self._request(_POWER_URLS[bool(power)])
 
     async def set_repeat_mode(self, mode: str) -> None:
         """Set the repeat mode.
@@ -414,7 +579,7 @@ class WiiMClient:
         Raises:
             ValueError: If an invalid repeat mode is specified.
         """
-        if mode not in (PLAY_MODE_NORMAL, PLAY_MODE_REPEAT_ALL, PLAY_MODE_REPEAT_ONE):
+        if mode not in _REPEAT_MODES:
             raise ValueError(f"Invalid repeat mode: {mode}")
         await self._request(f"{API_ENDPOINT_REPEAT}{mode}")
 
@@ -427,11 +592,7 @@ class WiiMClient:
         Raises:
             ValueError: If an invalid shuffle mode is specified.
         """
-        if mode not in (
-            PLAY_MODE_NORMAL,
-            PLAY_MODE_SHUFFLE,
-            PLAY_MODE_SHUFFLE_REPEAT_ALL,
-        ):
+        if mode not in _SHUFFLE_MODES:
             raise ValueError(f"Invalid shuffle mode: {mode}")
         await self._request(f"{API_ENDPOINT_SHUFFLE}{mode}")
 
@@ -671,23 +832,29 @@ class WiiMClient:
 
     # Device Info
     async def get_device_info(self) -> dict[str, Any]:
-        """Get device information."""
-        return await self._request(API_ENDPOINT_DEVICE_INFO)
+        """Get device information (cached until the next reboot)."""
+        if self._device_info is None:
+            self._device_info = await self._request(API_ENDPOINT_DEVICE_INFO)
+        return self._device_info
 
     async def get_firmware_version(self) -> str:
-        """Get firmware version."""
-        response = await self._request(API_ENDPOINT_FIRMWARE)
-        return response.get("firmware", "")
+        """Get firmware version (cached until the next reboot)."""
+        if self._firmware_version is None:
+            response = await self._request(API_ENDPOINT_FIRMWARE)
+            self._firmware_version = response.get("firmware", "")
+        return self._firmware_version
 
     async def get_mac_address(self) -> str:
-        """Get MAC address."""
-        response = await self._request(API_ENDPOINT_MAC)
-        return response.get("mac", "")
+        """Get MAC address (cached until the next reboot)."""
+        if self._mac_address is None:
+            response = await self._request(API_ENDPOINT_MAC)
+            self._mac_address = response.get("mac", "")
+        return self._mac_address
 
     # LED Control
     async def set_led(self, enabled: bool) -> None:
         """Set LED state."""
-        await self._request(f"{API_ENDPOINT_LED}{1 if enabled else 0}")
+        await self._request(_LED_URLS[bool(enabled)])
 
     async def set_led_brightness(self, brightness: int) -> None:
         """Set LED brightness (0-100)."""
@@ -731,8 +898,6 @@ class WiiMClient:
             - source: Current audio source
             - play_mode: Current play mode (normal/repeat/shuffle)
         """
-        from .const import API_ENDPOINT_PLAYER_STATUS
-
         try:
             raw: dict[str, Any] = await self._request(API_ENDPOINT_PLAYER_STATUS)
         except WiiMError:
@@ -741,28 +906,6 @@ class WiiMClient:
 
         return self._parse_player_status(raw)
 
-    # Normalisation table for the *player-status* endpoint.  Keys on the left
-    # are raw HTTP-API field names, values are our canonical attribute names
-    # used throughout the integration.
-    _STATUS_MAP: dict[str, str] = {
-        "status": "play_status",
-        "vol": "volume",
-        "mute": "mute",
-        "eq": "eq_preset",
-        "EQ": "eq_preset",        # Some firmwares use upper-case EQ
-        "eq_mode": "eq_preset",   # Seen on recent builds (e.g. W281)
-        "loop": "loop_mode",
-        "curpos": "position_ms",
-        "totlen": "duration_ms",
-        "Title": "title_hex",
-        "Artist": "artist_hex",
-        "Album": "album_hex",
-        "DeviceName": "device_name",
-        # Wi-Fi (only present in fallback)
-        "WifiChannel": "wifi_channel",
-        "RSSI": "wifi_rssi",
-    }
-
     # Mapping of ``mode`` codes → canonical source names.
     _MODE_MAP: dict[str, str] = {
         "0": "idle",        # idle/unknown
@@ -811,57 +954,48 @@ class WiiMClient:
         Returns:
             A dictionary containing normalized player status.
         """
-        _LOGGER.debug("Parsing raw player status: %s", raw)
-
-        data: dict[str, Any] = {}
+        debug = _LOGGER.isEnabledFor(logging.DEBUG)
+        if debug:
+            _LOGGER.debug("Parsing raw player status: %s", raw)
 
-        # Map raw keys to normalized keys
-        for k, v in raw.items():
-            key = self._STATUS_MAP.get(k, k)
-            data[key] = v
+        # Map raw keys to normalized keys (Wi-Fi fields included; keys not in
+        # the table pass through unchanged)
+        status_map = _STATUS_MAP
+        data: dict[str, Any] = {status_map.get(k, k): v for k, v in raw.items()}
 
-        # Decode hex-encoded metadata
-        data["title"] = _hex_to_str(raw.get("Title")) or raw.get("title")
-        data["artist"] = _hex_to_str(raw.get("Artist")) or raw.get("artist")
-        data["album"] = _hex_to_str(raw.get("Album")) or raw.get("album")
+        # Decode hex-encoded metadata – the raw hex values were carried over
+        # under their *_hex keys by the mapping above.
+        data["title"] = _hex_to_str(data.get("title_hex")) or raw.get("title")
+        data["artist"] = _hex_to_str(data.get("artist_hex")) or raw.get("artist")
+        data["album"] = _hex_to_str(data.get("album_hex")) or raw.get("album")
 
         # Power state (default to ON if not specified)
         data.setdefault("power", True)
 
-        # Wi-Fi diagnostics
-        if "wifi_channel" not in data and raw.get("wifi_channel"):
-            data["wifi_channel"] = raw["wifi_channel"]
-        if "wifi_rssi" not in data and raw.get("wifi_rssi"):
-            data["wifi_rssi"] = raw["wifi_rssi"]
-
         # Volume normalization (0-1 float)
         if (vol := raw.get("vol")) is not None:
-            try:
-                vol_int = int(vol)
+            if (vol_int := _to_int(vol)) is not None:
                 data["volume_level"] = vol_int / 100
                 data["volume"] = vol_int
-            except ValueError:
+            else:
                 _LOGGER.warning("Invalid volume value: %s", vol)
 
         # Position and duration in seconds
-        if raw.get("curpos"):
-            data["position"] = int(raw["curpos"]) // 1_000
-            data["position_updated_at"] = asyncio.get_running_loop().time()
-        if raw.get("totlen"):
-            data["duration"] = int(raw["totlen"]) // 1_000
+        if (curpos := _to_int(raw.get("curpos"))) is not None:
+            data["position"] = curpos // 1_000
+            data["position_updated_at"] = time.monotonic()
+        if (totlen := _to_int(raw.get("totlen"))) is not None:
+            data["duration"] = totlen // 1_000
 
         # Convert mute state to boolean
         if "mute" in data:
-            try:
-                data["mute"] = bool(int(data["mute"]))
-            except (TypeError, ValueError):
-                data["mute"] = bool(data["mute"])
+            mute_int = _to_int(data["mute"])
+            data["mute"] = bool(data["mute"] if mute_int is None else mute_int)
 
         # Map play mode from LinkPlay loop code
         if "play_mode" not in data and "loop_mode" in data:
-            try:
-                loop_val = int(data["loop_mode"])
-            except (TypeError, ValueError):
+            loop_val = _to_int(data["loop_mode"])
+            if loop_val is None:
                 loop_val = 4  # default = normal
 
             if loop_val == 0:
@@ -877,19 +1011,10 @@ class WiiMClient:
 
         # Artwork URL – vendors use a **lot** of different keys.  Try the
         # known variants in priority order so the first *non-empty* match wins.
-        cover = (
-            raw.get("cover")
-            or raw.get("cover_url")
-            or raw.get("albumart")
-            or raw.get("albumArtURI")
-            or raw.get("albumArtUri")
-            or raw.get("albumarturi")
-            or raw.get("art_url")
-            or raw.get("artwork_url")
-            or raw.get("pic_url")
-        )
-        if cover:
-            data["entity_picture"] = cover
+        for key in _COVER_KEYS:
+            if cover := raw.get(key):
+                data["entity_picture"] = cover
+                break
 
         # ---------------------------------------------------------------
         # Current *input* source – derived from ``mode`` field.  Not all
@@ -909,13 +1034,19 @@ class WiiMClient:
         if isinstance(eq_raw, (int, str)) and str(eq_raw).isdigit():
             data["eq_preset"] = self._EQ_NUMERIC_MAP.get(str(eq_raw), eq_raw)
 
-        _LOGGER.debug("Parsed player status: %s", data)
+        if debug:
+            _LOGGER.debug("Parsed player status: %s", data)
         return data
 
     async def get_multiroom_info(self) -> dict[str, Any]:
         """Get multiroom status."""
         response = await self._request(API_ENDPOINT_GROUP_SLAVES)
         _LOGGER.debug("[WiiM] get_multiroom_info response for %s: %s", self.host, response)
+        self._update_group_master(response)
+        return response
+
+    def _update_group_master(self, response: dict[str, Any]) -> None:
+        """Record the group master reported in a multiroom payload."""
         # Try to set group_master for slave
         if "master" in response:
             self._group_master = response["master"]
@@ -929,7 +1060,6 @@ class WiiMClient:
         else:
             self._group_master = None
             _LOGGER.debug("[WiiM] %s: No master info found in group info response.", self.host)
-        return response
 
     async def kick_slave(self, slave_ip: str) -> None:
         """Remove a slave device from the group."""
@@ -952,11 +1082,15 @@ class WiiMClient:
     async def reboot(self) -> None:
         """Reboot the device via HTTP API."""
         await self._request("/httpapi.asp?command=reboot")
+        # Firmware may change across a reboot – refetch identity data after
+        self._device_info = None
+        self._firmware_version = None
+        self._mac_address = None
 
     async def sync_time(self, ts: int | None = None) -> None:
         """Synchronise device RTC with Unix timestamp (defaults to *now*)."""
         if ts is None:
-            ts = int(asyncio.get_running_loop().time())
+            ts = int(time.time())
         await self._request(f"/httpapi.asp?command=timeSync:{ts}")
 
     async def get_meta_info(self) -> dict[str, Any]:
@@ -982,8 +1116,6 @@ class WiiMClient:
 
     async def play_notification(self, url: str) -> None:
         """Play a notification sound (lowers volume, plays, then restores)."""
-        from .const import API_ENDPOINT_PLAY_PROMPT_URL
-        from urllib.parse import quote
         encoded_url = quote(url, safe="")
         await self._request(f"{API_ENDPOINT_PLAY_PROMPT_URL}{encoded_url}")
 
@@ -1005,24 +1137,15 @@ class WiiMClient:
 # the Python standard library.
 
 
-async def _ensure_session(base_ssl_ctx: ssl.SSLContext | None) -> ClientSession:  # type: ignore
-    """Create a throw-away :class:`aiohttp.ClientSession` with our SSL context.
-
-    Helper for users that do not provide a session; we open one and make sure
-    the connector uses the given SSL context (or default verification disabled
-    if *None*).  The caller is responsible for closing it.
-    """
-
-    if base_ssl_ctx is None:
-        connector = aiohttp.TCPConnector(ssl=False)
-    else:
-        connector = aiohttp.TCPConnector(ssl=base_ssl_ctx)
-
-    return aiohttp.ClientSession(connector=connector)
+_SESSION_CALL_TIMEOUT = aiohttp.ClientTimeout(
+    total=DEFAULT_TIMEOUT, connect=_CONNECT_TIMEOUT, sock_read=DEFAULT_TIMEOUT
+)
 
 
-async def session_call_api(endpoint: str, session: ClientSession, command: str) -> str:
-    """Perform a **single GET** to the LinkPlay HTTP API and return raw text.
+async def _session_call_api_bytes(
+    endpoint: str, session: ClientSession, command: str
+) -> bytes:
+    """Perform a **single GET** to the LinkPlay HTTP API and return the body.
 
     Parameters
     ----------
@@ -1038,8 +1161,11 @@ async def session_call_api(endpoint: str, session: ClientSession, command: str)
     url = f"{endpoint}/httpapi.asp?command={command}"
 
     try:
-        async with async_timeout.timeout(DEFAULT_TIMEOUT):
-            response = await session.get(url, headers=HEADERS)
+        response = await session.get(
+            url,
+            ssl=_shared_ssl_context(),
+            timeout=_SESSION_CALL_TIMEOUT,
+        )
     except (asyncio.TimeoutError, ClientError, asyncio.CancelledError) as err:
         raise WiiMRequestError(f"{err} error requesting data from '{url}'") from err
 
@@ -1048,38 +1174,78 @@ async def session_call_api(endpoint: str, session: ClientSession, command: str)
             f"Unexpected HTTP status {response.status} received from '{url}'"
         )
 
-    return await response.text()
+    return await response.read()
+
+
+async def session_call_api(endpoint: str, session: ClientSession, command: str) -> str:
+    """Perform a **single GET** to the LinkPlay HTTP API and return raw text."""
+
+    raw = await _session_call_api_bytes(endpoint, session, command)
+    return raw.decode("utf-8", errors="replace")
 
 
 async def session_call_api_json(
     endpoint: str, session: ClientSession, command: str
 ) -> dict[str, str]:
-    """Call the API and JSON-decode the response."""
+    """Call the API and JSON-decode the response.
+
+    The raw bytes go straight to the parser – no intermediate ``str``.
+    """
 
-    raw = await session_call_api(endpoint, session, command)
+    raw = await _session_call_api_bytes(endpoint, session, command)
     try:
-        return json.loads(raw)
-    except json.JSONDecodeError as exc:
+        return _json_loads(raw)
+    except ValueError as exc:
         raise WiiMInvalidDataError(
-            f"Unexpected JSON ({raw[:80]}…) received from '{endpoint}'"
+            f"Unexpected JSON ({raw[:80].decode('utf-8', errors='replace')!r}…) "
+            f"received from '{endpoint}'"
         ) from exc
 
 
 async def session_call_api_ok(endpoint: str, session: ClientSession, command: str) -> None:
     """Call the API and assert the speaker answers exactly 'OK'."""
 
-    result = await session_call_api(endpoint, session, command)
-    if result.strip() != "OK":
+    raw = await _session_call_api_bytes(endpoint, session, command)
+    # Common case is a bare b"OK" – compare bytes before paying for strip().
+    if raw != b"OK" and raw.strip() != b"OK":
         raise WiiMRequestError(
-            f"Didn't receive expected 'OK' from {endpoint} (got {result!r})"
+            f"Didn't receive expected 'OK' from {endpoint} "
+            f"(got {raw.decode('utf-8', errors='replace')!r})"
         )
 
 
+def _to_int(val: Any) -> int | None:
+    """Return *val* as ``int`` or ``None`` if it is not an integer string.
+
+    Validates with ``str.isdecimal`` instead of try/except so the (frequent)
+    malformed or empty fields don't pay for exception handling.
+    """
+    if isinstance(val, int):
+        return val
+    if val is None:
+        return None
+    text = str(val).strip()
+    digits = text[1:] if text[:1] == "-" else text
+    return int(text) if digits.isdecimal() else None
+
+
+@functools.lru_cache(maxsize=512)
+def _hex_to_str_cached(val: str) -> str:
+    """Decode *val* – cached because the same metadata is re-sent every poll."""
+    try:
+        raw = binascii.unhexlify(val)
+    except binascii.Error:
+        # Whitespace between bytes – bytes.fromhex tolerates it and raises
+        # ValueError for anything that still is not hex.
+        raw = bytes.fromhex(val)
+    return raw.decode("utf-8", errors="replace")
+
+
 def _hex_to_str(val: str | None) -> str | None:
     """Decode hex‐encoded UTF-8 strings used by LinkPlay for metadata."""
     if not val:
         return None
     try:
-        return bytes.fromhex(val).decode("utf-8", errors="replace")
-    except ValueError:
+        return _hex_to_str_cached(val.strip())
+    except (ValueError, binascii.Error):
         return val  # already plain
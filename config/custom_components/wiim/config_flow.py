@@ -1,16 +1,21 @@
 from __future__ import annotations
 
+from functools import lru_cache
+import re
 from typing import Any
 from urllib.parse import urlparse
 import logging
 import asyncio
 
 import voluptuous as vol
+from aiohttp import ClientError, ClientSession, ClientTimeout
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
 from .api import WiiMClient, WiiMError
 from .const import (
@@ -31,24 +36,103 @@ import zeroconf
 
 _LOGGER = logging.getLogger(__name__)
 
-async def _async_validate_host(host: str) -> None:
-    """Validate we can talk to the WiiM device and always close the session."""
-    client = WiiMClient(host)
+# Maximum number of SSDP candidates probed over HTTP at the same time.
+_DISCOVERY_PROBE_CONCURRENCY = 8
+# SSDP listen window, and the hard cap on search plus the trailing probes.
+_DISCOVERY_SEARCH_TIMEOUT = 5
+_DISCOVERY_DEADLINE = 8
+# Discovery only needs a yes/no answer, so give up on silent hosts quickly
+# and read just enough of getStatusEx to spot LinkPlay-specific keys.
+_DISCOVERY_PROBE_TIMEOUT = ClientTimeout(total=1.5, connect=0.5)
+_DISCOVERY_PROBE_BYTES = 1024
+# DeviceName sits near the top of getStatusEx, inside the probe window.
+_DEVICE_NAME_RE = re.compile(rb'"DeviceName"\s*:\s*"([^"]*)"')
+# Same port order as WiiMClient: HTTPS on 443 first, plain HTTP on 80 for
+# LinkPlay modules that only serve the latter.
+_DISCOVERY_PROBE_URLS = (
+    "https://{host}/httpapi.asp?command=getStatusEx",
+    "http://{host}/httpapi.asp?command=getStatusEx",
+)
+
+# Validators and static schemas are built once at import time; only the
+# per-entry defaults are filled in when a form is shown.
+_HOST_SCHEMA = vol.Schema({vol.Required(CONF_HOST): str})
+_POLL_VALIDATOR = vol.All(vol.Coerce(int), vol.Range(min=1, max=60))
+_VOLUME_VALIDATOR = vol.All(vol.Coerce(float), vol.Range(min=0.01, max=0.5))
+
+
+@lru_cache(maxsize=256)
+def _host_from_location(location: str) -> str | None:
+    """Return the host of an SSDP LOCATION URL.
+
+    Speakers repeat the same LOCATION for every service type and every
+    NOTIFY, so the parse is cached across discovery runs.
+    """
+    return urlparse(location).hostname
+
+
+def _get_shared_session(hass: HomeAssistant) -> ClientSession:
+    """Return Home Assistant's pooled aiohttp session for device probes."""
+    return async_get_clientsession(hass)
+
+
+async def _async_validate_host(client: WiiMClient) -> dict[str, Any]:
+    """Validate we can talk to the WiiM device and return its status."""
     max_retries = 3
     retry_delay = 1  # seconds
 
     for attempt in range(max_retries):
         try:
-            await client.get_status()
-            return
+            return await client.get_status()
         except WiiMError as err:
             if attempt == max_retries - 1:
                 raise
-            _LOGGER.debug("Attempt %d failed to validate WiiM device at %s: %s", attempt + 1, host, err)
+            _LOGGER.debug("Attempt %d failed to validate WiiM device at %s: %s", attempt + 1, client.host, err)
             await asyncio.sleep(retry_delay)
-        finally:
-            # Ensure the underlying aiohttp session is closed even on failure
-            await client.close()
+
+
+async def _probe_wiim_device(host: str, session: ClientSession) -> str | None:
+    """Return the device name if *host* looks like a WiiM/LinkPlay speaker.
+
+    Returns ``None`` for anything else, and the host itself when the speaker
+    did not report a ``DeviceName`` within the probe window.
+
+    Cheap discovery-time check: only the head of the ``getStatusEx`` body is
+    read and scanned for keys every LinkPlay firmware sends up front.  The
+    JSON parser is only used when the whole (short) body fit in that window
+    but the byte scan was inconclusive.  The full validator is kept for the
+    confirm step.  Port 80 is only tried when HTTPS cannot be reached.
+    """
+    for url_template in _DISCOVERY_PROBE_URLS:
+        url = url_template.format(host=host)
+        complete = False
+        try:
+            # Speakers use self-signed certificates, so skip verification here.
+            async with session.get(url, ssl=False, timeout=_DISCOVERY_PROBE_TIMEOUT) as response:
+                if response.status != 200:
+                    return None
+                try:
+                    head = await response.content.readexactly(_DISCOVERY_PROBE_BYTES)
+                except asyncio.IncompleteReadError as err:
+                    head, complete = err.partial, True
+        except (asyncio.TimeoutError, ClientError, OSError):
+            continue
+        break
+    else:
+        return None
+    if b'"uuid"' in head and b'"firmware"' in head:
+        if match := _DEVICE_NAME_RE.search(head):
+            return match.group(1).decode("utf-8", errors="replace").strip() or host
+        return host
+    if not complete:
+        return None
+    try:
+        data = json_loads(head)
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or "uuid" not in data:
+        return None
+    return str(data.get("DeviceName") or "").strip() or host
 
 
 class WiiMConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -60,6 +144,12 @@ class WiiMConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Set up instance."""
         self._host: str | None = None
         self._discovered_hosts: dict[str, str] = {}
+        # Dropdown label→host map and its schema, built once per discovery.
+        self._options_map: dict[str, str] = {}
+        self._upnp_schema: vol.Schema | None = None
+        # One client per host for the lifetime of the flow so the learned
+        # port and cached device info survive between steps.
+        self._client_cache: dict[str, WiiMClient] = {}
 
     @staticmethod
     @callback
@@ -69,6 +159,21 @@ class WiiMConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         """Return the options flow."""
         return WiiMOptionsFlow(config_entry)
 
+    def _get_client(self, host: str) -> WiiMClient:
+        """Return the flow-scoped client for *host*, creating it on demand."""
+        if (client := self._client_cache.get(host)) is None:
+            client = self._client_cache[host] = WiiMClient(
+                host, session=_get_shared_session(self.hass)
+            )
+        return client
+
+    @callback
+    def async_remove(self) -> None:
+        """Close cached clients once the flow has finished or been aborted."""
+        for client in self._client_cache.values():
+            self.hass.async_create_task(client.close())
+        self._client_cache.clear()
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -77,7 +182,7 @@ class WiiMConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             host = user_input[CONF_HOST]
             try:
-                client = WiiMClient(host)
+                client = self._get_client(host)
                 info = await client.get_player_status()
                 # Use host/IP as unique_id to guarantee one entry per device
                 unique_id = host
@@ -91,7 +196,6 @@ class WiiMConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 device_name = info.get("device_name") or info.get("DeviceName") or host
                 model = info.get("device_model") or info.get("hardware") or ""
                 firmware = info.get("firmware") or ""
-                await client.close()
                 # Ensure no duplicate by checking configured entries **and**
                 # flows that are half-way through (scenario: two discoveries
                 # fire at the same time).
@@ -121,7 +225,6 @@ class WiiMConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 errors["base"] = "unknown"
         if async_search is not None:
             return await self.async_step_upnp()
-        schema = vol.Schema({vol.Required(CONF_HOST): str})
         # Try to show placeholders if we have info
         placeholders = {}
         if 'device_name' in locals():
@@ -131,64 +234,41 @@ class WiiMConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 "model": model,
                 "firmware": firmware,
             }
-        return self.async_show_form(step_id="user", data_schema=schema, errors=errors, description_placeholders=placeholders)
+        return self.async_show_form(step_id="user", data_schema=_HOST_SCHEMA, errors=errors, description_placeholders=placeholders)
 
     async def async_step_upnp(self, user_input: dict[str, Any] | None = None) -> FlowResult:
         """Discover WiiM/LinkPlay devices via UPnP/SSDP."""
         errors: dict[str, str] = {}
         if not self._discovered_hosts:
             # Perform UPnP discovery.  Returns dict{host: friendly_name}
-            self._discovered_hosts = await self._discover_upnp_hosts()
+            self._set_discovered_hosts(await self._discover_upnp_hosts())
         if user_input is not None:
             selected = user_input[CONF_HOST]
-            if hasattr(self, "_options_map") and selected in self._options_map:  # type: ignore[attr-defined]
-                host = self._options_map[selected]  # type: ignore[attr-defined]
-            else:
-                host = selected
+            host = self._options_map.get(selected, selected)
             await self.async_set_unique_id(host)
             self._abort_if_unique_id_configured()
             try:
-                await _async_validate_host(host)
+                info = await _async_validate_host(self._get_client(host))
             except WiiMError:
                 errors["base"] = "cannot_connect"
             else:
-                # Fetch device name for nicer entry title
-                device_name = host
-                client = None
-                try:
-                    client = WiiMClient(host)
-                    info = await client.get_player_status()
-                    device_name = info.get("device_name") or info.get("DeviceName") or host
-                except Exception:
-                    pass
-                finally:
-                    if client is not None:
-                        try:
-                            await client.close()
-                        except Exception:
-                            pass
+                # getStatusEx already carries the name for a nicer entry title
+                device_name = info.get("device_name") or host
                 return self.async_create_entry(
                     title=device_name,
                     data={CONF_HOST: host},
                 )
         if self._discovered_hosts:
-            # Build a label→host map so the dropdown shows nice names
-            options_map = {
-                f"{name} ({host})": host for host, name in self._discovered_hosts.items()
-            }
-            self._options_map = options_map  # type: ignore[attr-defined]
-            schema = vol.Schema({vol.Required(CONF_HOST): vol.In(list(options_map.keys()))})
             # Try to show placeholders for the first discovered device
             first_host = next(iter(self._discovered_hosts), None)
             placeholders = {}
             if first_host:
                 try:
-                    client = WiiMClient(first_host)
+                    client = self._get_client(first_host)
                     info = await client.get_player_status()
                     device_name = info.get("device_name") or info.get("DeviceName") or first_host
                     model = info.get("device_model") or info.get("hardware") or ""
                     firmware = info.get("firmware") or ""
-                    await client.close()
                     placeholders = {
                         "device_name": device_name,
                         "host": first_host,
@@ -199,62 +279,118 @@ class WiiMConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     pass
             return self.async_show_form(
                 step_id="upnp",
-                data_schema=schema,
+                data_schema=self._upnp_schema,
                 errors=errors,
                 description_placeholders=placeholders,
             )
         # If no devices found, fall back to manual
-        schema = vol.Schema({vol.Required(CONF_HOST): str})
-        return self.async_show_form(step_id="user", data_schema=schema, errors=errors)
+        return self.async_show_form(step_id="user", data_schema=_HOST_SCHEMA, errors=errors)
+
+    def _set_discovered_hosts(self, hosts: dict[str, str]) -> None:
+        """Store discovery results and build the dropdown schema once.
+
+        Hosts are sorted so the dropdown order is stable between renders.
+        """
+        self._discovered_hosts = dict(sorted(hosts.items()))
+        # Build a label→host map so the dropdown shows nice names
+        self._options_map = {
+            (f"{name} ({host})" if name != host else host): host
+            for host, name in self._discovered_hosts.items()
+        }
+        self._upnp_schema = vol.Schema(
+            {vol.Required(CONF_HOST): vol.In(tuple(self._options_map))}
+        )
 
     async def _discover_upnp_hosts(self) -> dict[str, str]:
         """Discover devices and return mapping of host→friendly name."""
         if async_search is None:
             return {}
 
+        queued: set[str] = set()
+        seen_locations: set[str] = set()
         discovered: dict[str, str] = {}
+        queue: asyncio.Queue[str] = asyncio.Queue()
         known_ids = {entry.unique_id for entry in self._async_current_entries()}
         in_progress_ids = {flow['context'].get('unique_id') for flow in self.hass.config_entries.flow.async_progress() if flow['handler'] == DOMAIN}
         all_known = known_ids | in_progress_ids
+        session = _get_shared_session(self.hass)
 
         async def _on_ssdp_device(device):
             """Callback fired for every SSDP/UPnP response.
 
-            We immediately open a TCP connection to the reported host and run
-            `get_player_status` to obtain the device name and confirm it is in
-            fact a WiiM/LinkPlay speaker.  Early filtering avoids showing
-            random DLNA renderers in the dropdown.
+            Only queues the host and returns – the probes run in separate
+            consumer tasks so a slow speaker cannot hold up the SSDP receive
+            loop and make us miss later replies.
             """
             host: str | None = getattr(device, "host", None)
-            if host is None and (loc := getattr(device, "location", None)):
-                host = urlparse(loc).hostname
-            if not host or host in discovered:
-                return
-            try:
-                client = WiiMClient(host)
-                info = await client.get_player_status()
-                # Use host/IP as unique_id to guarantee one entry per device
-                unique_id = host
-                await client.close()
-                if unique_id in all_known:
+            if host is None:
+                # Devices answer once per service type; parse each LOCATION once.
+                loc = getattr(device, "location", None)
+                if not loc or loc in seen_locations:
                     return
-            except Exception:
-                return
-            discovered[host] = info.get("device_name") or host
+                seen_locations.add(loc)
+                host = _host_from_location(loc)
+            # Use host/IP as unique_id to guarantee one entry per device
+            if host and host not in all_known and host not in queued:
+                queued.add(host)
+                queue.put_nowait(host)
+
+        async def _consume() -> None:
+            """Confirm queued hosts are WiiM/LinkPlay speakers.
 
+            Early filtering avoids showing random DLNA renderers in the
+            dropdown.
+            """
+            while True:
+                host = await queue.get()
+                try:
+                    if (name := await _probe_wiim_device(host, session)) is not None:
+                        discovered[host] = name
+                except Exception as err:  # noqa: BLE001 – never stall queue.join()
+                    _LOGGER.debug("Discovery probe of %s failed: %s", host, err)
+                finally:
+                    queue.task_done()
+
+        search_kwargs = {
+            "async_callback": _on_ssdp_device,
+            "timeout": _DISCOVERY_SEARCH_TIMEOUT,
+            "search_target": "urn:schemas-upnp-org:device:MediaRenderer:1",
+        }
+        async def _search() -> None:
+            """Run the SSDP search.
+
+            A failing search only ends discovery early – it must not escape
+            the TaskGroup as an ExceptionGroup and fail the whole flow step.
+            Hosts queued so far are still probed.
+            """
+            try:
+                try:
+                    await async_search(**search_kwargs, mx=2)
+                except TypeError:
+                    # Older async_upnp_client releases don't accept ``mx``
+                    await async_search(**search_kwargs)
+            except Exception as err:  # noqa: BLE001 – degrade to what was found
+                _LOGGER.warning("UPnP discovery search failed: %s", err)
+
+        # The number of consumers bounds how many probes run at once.  The
+        # TaskGroup guarantees none outlive this call, and the overall
+        # deadline returns whatever was confirmed so far.
         try:
-            await async_search(
-                async_callback=_on_ssdp_device,
-                timeout=5,
-                search_target="urn:schemas-upnp-org:device:MediaRenderer:1",
-                mx=2,
-            )
-        except TypeError:
-            await async_search(
-                async_callback=_on_ssdp_device,
-                timeout=5,
-                search_target="urn:schemas-upnp-org:device:MediaRenderer:1",
-            )
+            async with asyncio.timeout(_DISCOVERY_DEADLINE):
+                async with asyncio.TaskGroup() as tg:
+                    consumers = [
+                        tg.create_task(_consume())
+                        for _ in range(_DISCOVERY_PROBE_CONCURRENCY)
+                    ]
+                    try:
+                        await _search()
+                        await queue.join()
+                    finally:
+                        for task in consumers:
+                            task.cancel()
+        except TimeoutError:
+            _LOGGER.debug("UPnP discovery deadline hit; returning %d confirmed host(s)", len(discovered))
+
         return discovered
 
     async def async_step_zeroconf(self, discovery_info: zeroconf.ZeroconfServiceInfo) -> FlowResult:
@@ -275,7 +411,7 @@ class WiiMConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         await self.async_set_unique_id(unique_id)
         self._abort_if_unique_id_configured(updates={CONF_HOST: host})
         try:
-            client = WiiMClient(host)
+            client = self._get_client(host)
             info = await client.get_player_status()
             # If device is in a group, ungroup it to enumerate all devices
             if info.get("role") == "slave" or info.get("group") == "1":
@@ -285,7 +421,6 @@ class WiiMConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     pass
                 info = await client.get_player_status()
             device_name = info.get("device_name") or info.get("DeviceName") or host
-            await client.close()
         except WiiMError as err:
             _LOGGER.error("Failed to validate WiiM device at %s from Zeroconf: %s", host, err)
             return self.async_abort(reason="cannot_connect")
@@ -325,18 +460,18 @@ class WiiMConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         host = discovery_info.ssdp_headers.get("_host")
         if not host:
             if loc := discovery_info.ssdp_headers.get("ssdp_location"):
-                host = urlparse(loc).hostname
+                host = _host_from_location(loc)
             elif loc := discovery_info.ssdp_location:
-                host = urlparse(loc).hostname
+                host = _host_from_location(loc)
             elif "LOCATION" in discovery_info.ssdp_headers:
-                host = urlparse(discovery_info.ssdp_headers["LOCATION"]).hostname
+                host = _host_from_location(discovery_info.ssdp_headers["LOCATION"])
             elif "location" in discovery_info.ssdp_headers:
-                host = urlparse(discovery_info.ssdp_headers["location"]).hostname
+                host = _host_from_location(discovery_info.ssdp_headers["location"])
         if not host:
             return self.async_abort(reason="no_host")
         # Fetch unique_id and filter
         try:
-            client = WiiMClient(host)
+            client = self._get_client(host)
             info = await client.get_player_status()
             # Use host/IP as unique_id to guarantee one entry per device
             unique_id = host
@@ -348,7 +483,6 @@ class WiiMConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                     pass
                 info = await client.get_player_status()
             device_name = info.get("device_name") or info.get("DeviceName") or host
-            await client.close()
         except Exception:
             return self.async_abort(reason="cannot_connect")
         known_ids = {entry.unique_id for entry in self._async_current_entries()}
@@ -395,13 +529,13 @@ class WiiMOptionsFlow(config_entries.OptionsFlow):
                     default=self.entry.options.get(
                         CONF_POLL_INTERVAL, DEFAULT_POLL_INTERVAL
                     ),
-                ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+                ): _POLL_VALIDATOR,
                 vol.Optional(
                     CONF_VOLUME_STEP,
                     default=self.entry.options.get(
                         CONF_VOLUME_STEP, DEFAULT_VOLUME_STEP
                     ),
-                ): vol.All(vol.Coerce(float), vol.Range(min=0.01, max=0.5)),
+                ): _VOLUME_VALIDATOR,
                 vol.Optional(
                     "debug_logging",
                     default=self.entry.options.get("debug_logging", False),
@@ -32,10 +32,17 @@ from __future__ import annotations
 
 DOMAIN = "wiim"
 
+# hass.data key for the host/IP → coordinator index (O(1) cross-device lookups)
+DATA_COORDINATORS_BY_IP = f"{DOMAIN}_by_ip"
+
+# hass.data key for the media player entity_id → coordinator index
+DATA_COORDINATORS_BY_ENTITY_ID = f"{DOMAIN}_by_entity_id"
+
 # Config keys
 CONF_HOST = "host"
 CONF_POLL_INTERVAL = "poll_interval"
 CONF_VOLUME_STEP = "volume_step"
+CONF_CACHED_DEVICE_NAME = "cached_device_name"
 
 # Defaults
 DEFAULT_PORT = 443  # HTTPS
@@ -3,24 +3,60 @@
 from __future__ import annotations
 
 import logging
+import random
 from datetime import timedelta
 from typing import Any
 import asyncio
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.debounce import Debouncer
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.event import async_track_state_change_event
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
 from .api import WiiMClient, WiiMError
 from .const import (
     ATTR_GROUP_MEMBERS,
     ATTR_GROUP_LEADER,
+    CONF_CACHED_DEVICE_NAME,
     CONF_HOST,
+    DATA_COORDINATORS_BY_IP,
     DEFAULT_POLL_INTERVAL,
+    DEFAULT_VOLUME_STEP,
     DOMAIN,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Adaptive polling: multiples of the configured poll interval per play state.
+# Anything not listed (idle, "none", unknown) uses the idle factor.
+_STATE_INTERVAL_FACTORS: dict[str | None, int] = {
+    "play": 1,
+    "load": 1,
+    "pause": 3,
+    "stop": 6,
+}
+_IDLE_INTERVAL_FACTOR = 6
+# Never poll a device more often than this (seconds).
+_MIN_POLL_INTERVAL = 1
+
+# Coalescing window for refreshes requested after commands (seconds).
+_REQUEST_REFRESH_COOLDOWN = 0.3
+
+# Cap on concurrently running slave import flows across all coordinators, so
+# a burst of newly seen slaves doesn't hammer the config-flow machinery.  The
+# semaphore itself lives in hass.data[DOMAIN] under this key.
+_MAX_CONCURRENT_IMPORT_FLOWS = 3
+_IMPORT_FLOW_SEMAPHORE_KEY = "_import_flow_semaphore"
+
+
+def _update_member(members: dict[str, dict], ip: str, **fields: Any) -> None:
+    """Update the member entry for *ip* in place, creating it if missing."""
+    if (member := members.get(ip)) is None:
+        members[ip] = fields
+    else:
+        member.update(fields)
+
 
 class WiiMCoordinator(DataUpdateCoordinator):
     """WiiM coordinator for handling device updates and groups.
@@ -66,20 +102,38 @@ class WiiMCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=f"{DOMAIN}_{client._host}",
             update_interval=timedelta(seconds=poll_interval),
+            # Commands request a refresh instead of polling right away so a
+            # burst (slider drag, repeated next-track) costs a single poll.
+            request_refresh_debouncer=Debouncer(
+                hass, _LOGGER, cooldown=_REQUEST_REFRESH_COOLDOWN, immediate=False
+            ),
         )
         self.client = client
-        self._group_members: set[str] = set()
+        # Always a dict so callers never need an isinstance() guard
+        self.data: dict[str, Any] = {}
+        self._group_members: frozenset[str] = frozenset()
         self._is_ha_group_leader = False
-        self._ha_group_members: set[str] = set()
+        self._ha_group_members: frozenset[str] = frozenset()
+        # Entity ID of this speaker's media player; fixed for the coordinator's lifetime
+        self._ha_entity_id = f"media_player.wiim_{client._host.replace('.', '_')}"
         self._base_poll_interval = poll_interval  # seconds
+        # Relative volume step (0..1) from the entry options; kept current by
+        # the options-update listener so volume up/down needn't look it up.
+        self.volume_step: float = DEFAULT_VOLUME_STEP
         self._consecutive_failures = 0
+        # device_info cache and the (name, model, firmware, MAC) it was built from
+        self._device_info_key: tuple | None = None
+        self._device_info: DeviceInfo | None = None
         self._imported_hosts: set[str] = set()
         # New: group registry
         self._groups: dict[str, dict] = {}  # master_ip -> group info
-        self._last_title = None
+        self._last_meta_sig: int | None = None
         self._last_meta_info = {}
         self._meta_info_unsupported = False
         self._status_unsupported = False
+        # Whether getStatusEx embeds the multiroom slave list, making the
+        # separate getSlaveList request redundant (None = not yet known).
+        self._multiroom_in_status: bool | None = None
         self._logged_entity_not_found_for_ha_group = False
         # Capability flags exposed to UI controls
         self.eq_supported: bool = True  # cleared when /getEQ answers "unknown command"
@@ -89,11 +143,7 @@ class WiiMCoordinator(DataUpdateCoordinator):
         # entity will expose the selector unconditionally so users can swap
         # between Wi-Fi, Bluetooth, Line-In, etc. directly from Home-Assistant.
         self.source_supported: bool = True
-        # Adaptive polling state
-        self._last_play_state = None
-        self._last_play_time = None
         self._eq_poll_counter = 0
-        self._idle_timeout = 600  # 10 minutes in seconds
 
     def _parse_plm_support(self, plm_support: str) -> list[str]:
         """Parse plm_support bitmask into list of available sources."""
@@ -126,6 +176,59 @@ class WiiMCoordinator(DataUpdateCoordinator):
             _LOGGER.error("[WiiM] Failed to parse plm_support: %s", plm_support)
             return []
 
+    def _interval_for_state(self, play_state: str | None) -> timedelta:
+        """Return the poll interval for *play_state* (adaptive polling).
+
+        Playing devices are polled at the configured rate; paused, stopped
+        and unknown states back off to a multiple of it.
+        """
+        factor = _STATE_INTERVAL_FACTORS.get(play_state, _IDLE_INTERVAL_FACTOR)
+        return timedelta(seconds=max(_MIN_POLL_INTERVAL, self._base_poll_interval * factor))
+
+    def set_base_poll_interval(self, seconds: int) -> None:
+        """Apply a new configured poll interval (e.g. from the options flow).
+
+        The effective interval is recomputed for the current play state so a
+        paused or idle speaker keeps its backed-off rate.
+        """
+        self._base_poll_interval = seconds
+        self.update_interval = self._interval_for_state(self.data.get("status", {}).get("play_status"))
+
+    async def _async_fetch_player_status(self) -> tuple[dict[str, Any] | WiiMError, dict[str, Any]]:
+        """Fetch getPlayerStatus, then getMetaInfo when the track changed.
+
+        Runs as one branch of the poll's gather so the meta request overlaps
+        getStatusEx / multiroom instead of adding a serial round-trip.  The
+        meta request is only made when the raw title/album/artist signature
+        changes; a steady track reuses the cached copy.  A failed fetch after
+        a track change yields no meta info – the cached copy belongs to the
+        previous track.
+
+        Returns the player status (or the WiiMError it raised) and the meta
+        info belonging to it ({} when none is known).
+        """
+        try:
+            player_status = await self.client.get_player_status()
+        except WiiMError as err:
+            return err, {}
+
+        meta_sig = hash((player_status.get("title"), player_status.get("album"), player_status.get("artist")))
+        if meta_sig == self._last_meta_sig:
+            return player_status, self._last_meta_info
+        if self._meta_info_unsupported:
+            return player_status, {}
+        try:
+            meta_info = await self.client.get_meta_info()
+        except WiiMError as err:
+            _LOGGER.debug("[WiiM] get_meta_info failed on %s: %s", self.client.host, err)
+            return player_status, {}
+        if not meta_info:
+            # Empty dict – very likely unsupported on this device
+            self._meta_info_unsupported = True
+        self._last_meta_sig = meta_sig
+        self._last_meta_info = meta_info
+        return player_status, meta_info
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Update data from WiiM device."""
         try:
@@ -134,77 +237,80 @@ class WiiMCoordinator(DataUpdateCoordinator):
             basic_status: dict[str, Any]
             multiroom: dict[str, Any]
 
-            # 1) Player status (getPlayerStatus) - primary source of playback state
-            try:
-                player_status = await self.client.get_player_status()
-            except WiiMError as err:
-                _LOGGER.debug("[WiiM] get_player_status failed on %s: %s", self.client.host, err)
+            # Player status, basic status and multiroom info are independent –
+            # fetch them concurrently so one poll costs a single round-trip.
+            # 1) getPlayerStatus – primary source of playback state, chained
+            #    with getMetaInfo (artwork & clean track names) on track change
+            # 2) getStatusEx – device info (name, firmware …); skipped once
+            #    the device has told us it does not support it
+            # 3) multiroom info – required for group management
+            #    – unless getStatusEx already carries it (learned below)
+            fetch_status = not self._status_unsupported
+            fused = fetch_status and self._multiroom_in_status is True
+            results = await asyncio.gather(
+                self._async_fetch_player_status(),
+                self.client.get_status() if fetch_status else asyncio.sleep(0, {}),
+                asyncio.sleep(0, None) if fused else self.client.get_multiroom_info(),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException) and not isinstance(result, WiiMError):
+                    raise result
+            (player_result, meta_info), status_result, multiroom_result = results
+
+            if isinstance(player_result, WiiMError):
+                _LOGGER.debug("[WiiM] get_player_status failed on %s: %s", self.client.host, player_result)
                 player_status = {}
+            else:
+                player_status = player_result
 
-            # 2) Basic status (getStatusEx) – skip if we previously marked unsupported
-            # This provides additional device info like firmware version, device name, etc.
-            if self._status_unsupported:
+            if isinstance(status_result, WiiMError):
+                _LOGGER.debug("[WiiM] get_status unsupported on %s: %s (will not retry)", self.client.host, status_result)
                 basic_status = {}
+                self._status_unsupported = True
             else:
-                try:
-                    basic_status = await self.client.get_status()
-                except WiiMError as err:
-                    _LOGGER.debug("[WiiM] get_status unsupported on %s: %s (will not retry)", self.client.host, err)
-                    basic_status = {}
-                    self._status_unsupported = True
-
-            # 3) Multiroom info (always attempted) - required for group management
-            try:
-                multiroom = await self.client.get_multiroom_info()
-            except WiiMError as err:
-                _LOGGER.debug("[WiiM] get_multiroom_info failed on %s: %s", self.client.host, err)
+                basic_status = status_result
+
+            embedded = basic_status.get("multiroom")
+            has_embedded = isinstance(embedded, dict) and "slave_list" in embedded
+            if fused:
+                if has_embedded:
+                    multiroom = embedded
+                    self.client._update_group_master(multiroom)
+                else:
+                    # Field vanished (e.g. after a firmware update) – go
+                    # back to the dedicated endpoint for good.
+                    self._multiroom_in_status = False
+                    try:
+                        multiroom_result = await self.client.get_multiroom_info()
+                    except WiiMError as err:
+                        multiroom_result = err
+            elif fetch_status and basic_status and self._multiroom_in_status is None:
+                self._multiroom_in_status = has_embedded
+
+            if multiroom_result is None:
+                pass  # already taken from getStatusEx above
+            elif isinstance(multiroom_result, WiiMError):
+                _LOGGER.debug("[WiiM] get_multiroom_info failed on %s: %s", self.client.host, multiroom_result)
                 multiroom = {}
+            else:
+                multiroom = multiroom_result
 
             # ------------------------------------------------------------------
-            # Bail out early if *all* three primary endpoints failed.  Returning
-            # an empty payload would incorrectly mark ``last_update_success`` as
-            # True even though we have **zero** data.  Instead raise a
-            # ``WiiMError`` which the outer handler converts into UpdateFailed.
+            # Bail out early if *both* status endpoints failed.  A failed
+            # multiroom call alone just degrades the device to solo, but
+            # multiroom info without any status would incorrectly mark
+            # ``last_update_success`` as True with nothing to show.  Instead
+            # raise a ``WiiMError`` which the outer handler converts into
+            # UpdateFailed.
             # ------------------------------------------------------------------
-            if not player_status and not basic_status and not multiroom:
+            if not player_status and not basic_status:
                 raise WiiMError("All status endpoints failed")
 
             # Merge status data, preferring player_status for playback state
             status = {**basic_status, **player_status}
-            current_title = status.get("title")
             current_play_state = status.get("play_status")
 
-            # Update adaptive polling state
-            now = asyncio.get_running_loop().time()
-            if current_play_state != self._last_play_state:
-                self._last_play_state = current_play_state
-                self._last_play_time = now
-
-            # Determine polling interval based on state
-            if current_play_state == "play":
-                # Active playback - poll every second
-                self.update_interval = timedelta(seconds=1)
-            elif self._last_play_time and (now - self._last_play_time) < self._idle_timeout:
-                # Recently played - poll every 5 seconds
-                self.update_interval = timedelta(seconds=5)
-            else:
-                # Idle - poll every 10 seconds
-                self.update_interval = timedelta(seconds=10)
-
-            # Only fetch meta info if supported & title changed
-            if not self._meta_info_unsupported and (
-                current_title != self._last_title or not self._last_meta_info
-            ):
-                meta_info = await self.client.get_meta_info()
-                if not meta_info:
-                    # Empty dict – very likely unsupported on this device
-                    self._meta_info_unsupported = True
-                else:
-                    self._last_title = current_title
-                    self._last_meta_info = meta_info
-            else:
-                meta_info = self._last_meta_info
-
             # Merge meta info
             if meta_info:
                 status["album"] = meta_info.get("album")
@@ -213,7 +319,7 @@ class WiiMCoordinator(DataUpdateCoordinator):
                 status["entity_picture"] = meta_info.get("albumArtURI")
 
             # ------------------------------------------------------------------
-            # 4) EQ information – poll at 1/3 rate and only if supported
+            # 5) EQ information – poll at 1/3 rate and only if supported
             # ------------------------------------------------------------------
             self._eq_poll_counter += 1
             if self.eq_supported and self._eq_poll_counter >= 3:
@@ -276,7 +382,7 @@ class WiiMCoordinator(DataUpdateCoordinator):
                 # Many firmwares include **extra context** after a colon
                 # (e.g. "Spotify:Station:Playlist:…").  Keep only the
                 # provider name so the HA card shows a clean label.
-                vendor_clean = vendor_raw.split(":", 1)[0]
+                vendor_clean = vendor_raw.partition(":")[0]
                 status["streaming_service"] = vendor_clean.title()
 
             # Determine role
@@ -288,25 +394,25 @@ class WiiMCoordinator(DataUpdateCoordinator):
             elif multiroom.get("slave_list"):
                 role = "master"
 
+            self._invalidate_cached_device_name(status)
+
             # Update group registry
             self._update_group_registry(status, multiroom)
 
-            # If we reach here the poll succeeded – reset failure counter and interval
-            if self._consecutive_failures:
-                self._consecutive_failures = 0
-                if (
-                    self.update_interval is not None
-                    and self.update_interval.total_seconds() != self._base_poll_interval
-                ):
-                    self.update_interval = timedelta(seconds=self._base_poll_interval)
+            # If we reach here the poll succeeded – reset failure counter and
+            # pick the interval for the current playback state (this also
+            # ends any failure back-off).
+            self._consecutive_failures = 0
+            interval = self._interval_for_state(current_play_state)
+            if self.update_interval != interval:
+                self.update_interval = interval
 
             # Update multiroom status & trigger discovery of new slave IPs
-            self._group_members = {
+            self._group_members = frozenset(
                 entry.get("ip") for entry in multiroom.get("slave_list", []) if entry.get("ip")
-            }
+            )
 
             await self._async_trigger_slave_discovery()
-            self._update_ha_group_status()
 
             # ------------------------------------------------------------------
             # Post-process *source* to avoid confusing "Follower" on SOLO / MASTER
@@ -332,17 +438,36 @@ class WiiMCoordinator(DataUpdateCoordinator):
             # Progressive back-off on consecutive failures to reduce log spam
             self._consecutive_failures += 1
             if self._consecutive_failures >= 3:
-                new_interval = min(
-                    self._base_poll_interval * (2 ** (self._consecutive_failures - 2)),
-                    60,
+                # Never poll a failing device faster than its healthy
+                # interval for the last known play state.
+                floor = self._interval_for_state(
+                    self.data.get("status", {}).get("play_status")
+                ).total_seconds()
+                new_interval = max(
+                    floor,
+                    min(self._base_poll_interval * (2 ** (self._consecutive_failures - 2)), 60),
                 )
-                if (
-                    self.update_interval is None
-                    or new_interval != self.update_interval.total_seconds()
-                ):
-                    self.update_interval = timedelta(seconds=new_interval)
+                # Jitter the retry so speakers that failed together (network
+                # blip, HA restart) don't keep polling in lockstep.
+                new_interval = random.uniform(floor, new_interval)
+                self.update_interval = timedelta(seconds=new_interval)
             raise UpdateFailed(f"Error updating WiiM device: {err}")
 
+    def _invalidate_cached_device_name(self, status: dict) -> None:
+        """Drop the entry's cached device name once the device reports a new one."""
+        device_name = status.get("device_name")
+        entry_id = getattr(self, "entry_id", None)
+        if not device_name or entry_id is None:
+            return
+        entry = self.hass.config_entries.async_get_entry(entry_id)
+        if entry is None:
+            return
+        cached = entry.data.get(CONF_CACHED_DEVICE_NAME)
+        if cached and cached != device_name:
+            _LOGGER.debug("[WiiM] %s: device renamed %s -> %s", self.client.host, cached, device_name)
+            data = {k: v for k, v in entry.data.items() if k != CONF_CACHED_DEVICE_NAME}
+            self.hass.config_entries.async_update_entry(entry, data=data)
+
     def _update_group_registry(self, status: dict, multiroom: dict) -> None:
         """Update the group registry with current group info."""
         _LOGGER.debug("[WiiM] _update_group_registry: status=%s, multiroom=%s", status, multiroom)
@@ -403,34 +528,59 @@ class WiiMCoordinator(DataUpdateCoordinator):
         master_name = status.get("device_name") or "WiiM Group"
         group_info = self._groups.setdefault(master_ip, {"members": {}, "master": master_ip, "name": master_name})
         group_info["name"] = master_name  # Always update name in case it changes
+        # Member dicts are updated in place so their identity is stable
+        # across polls; only joins and leaves add or remove entries.
+        members = group_info["members"]
         # Add master
-        group_info["members"][self.client.host] = {
-            "volume": status.get("volume", 0),
-            "mute": status.get("mute", False),
-            "state": status.get("play_status"),
-            "name": master_name,
-        }
+        _update_member(
+            members,
+            self.client.host,
+            volume=status.get("volume", 0),
+            mute=status.get("mute", False),
+            state=status.get("play_status"),
+            name=master_name,
+        )
+        current_ips = {self.client.host}
         # Add slaves
         for entry in multiroom.get("slave_list", []):
             ip = entry.get("ip")
             if not ip:
                 continue
-            slave_name = entry.get("name") or f"WiiM {ip}"
-            group_info["members"][ip] = {
-                "volume": entry.get("volume", 0),
-                "mute": bool(entry.get("mute", False)),
-                "state": None,  # Will be filled in by polling that device
-                "name": slave_name,
-            }
+            current_ips.add(ip)
+            _update_member(
+                members,
+                ip,
+                volume=entry.get("volume", 0),
+                mute=bool(entry.get("mute", False)),
+                state=None,  # Will be filled in by polling that device
+                name=entry.get("name") or f"WiiM {ip}",
+            )
         # Clean up any members no longer present
-        current_ips = {self.client.host} | {entry.get("ip") for entry in multiroom.get("slave_list", []) if entry.get("ip")}
-        group_info["members"] = {ip: v for ip, v in group_info["members"].items() if ip in current_ips}
+        for ip in members.keys() - current_ips:
+            del members[ip]
         _LOGGER.debug("[WiiM] _update_group_registry: group_info=%s", group_info)
 
-    def _update_ha_group_status(self) -> None:
+    @callback
+    def async_track_ha_group(self) -> CALLBACK_TYPE:
+        """Follow HA group changes on this speaker's media player entity.
+
+        HA group membership only changes when the user regroups, so it is
+        read on state changes instead of on every poll.  Returns the
+        unsubscribe callback.
+        """
+        self._update_ha_group_status(self.hass.states.get(self._ha_entity_id))
+        return async_track_state_change_event(
+            self.hass, [self._ha_entity_id], self._handle_ha_group_change
+        )
+
+    @callback
+    def _handle_ha_group_change(self, event: Event) -> None:
+        """Refresh HA group status from a state-change event."""
+        self._update_ha_group_status(event.data.get("new_state"))
+
+    def _update_ha_group_status(self, entity: State | None) -> None:
         """Update Home Assistant group status."""
-        entity_id = f"media_player.wiim_{self.client._host.replace('.', '_')}"
-        entity = self.hass.states.get(entity_id)
+        entity_id = self._ha_entity_id
 
         if entity is None:
             if not hasattr(self, '_logged_entity_not_found_for_ha_group') or not self._logged_entity_not_found_for_ha_group:
@@ -451,21 +601,29 @@ class WiiMCoordinator(DataUpdateCoordinator):
 
         _LOGGER.debug("[WiiM] Coordinator: Entity %s group_members: %s, group_leader: %s", entity_id, group_members, group_leader)
 
-        self._ha_group_members = set(group_members)
+        self._ha_group_members = frozenset(group_members)
         self._is_ha_group_leader = group_leader == entity_id
 
     async def _async_trigger_slave_discovery(self) -> None:
         """Start config flows for new slave IPs that HA doesn't know yet."""
-        for ip in self._group_members:
-            if ip in self._imported_hosts:
-                continue
+        # Resolve everything HA already knows once, instead of rescanning
+        # every coordinator/config entry for each slave IP.
+        known = self.hass.data.get(DATA_COORDINATORS_BY_IP, {}).keys()
+        new = self._group_members - self._imported_hosts - known
+        self._imported_hosts |= self._group_members & known
+        if not new:
+            return
+        self._imported_hosts |= new
+        entry_hosts = {
+            entry.data.get(CONF_HOST) for entry in self.hass.config_entries.async_entries(DOMAIN)
+        }
 
-            # Skip if already present – ensure we only inspect coordinator objects
-            if any(
-                hasattr(coord, "client") and coord.client.host == ip
-                for coord in self.hass.data.get(DOMAIN, {}).values()
-            ):
-                self._imported_hosts.add(ip)
+        for ip in new:
+            # Prevent duplicate config-entries: skip if another entry already
+            # has the same host (even if its unique_id differs for legacy
+            # reasons or the entry is not fully set up yet)
+            if ip in entry_hosts:
+                _LOGGER.debug("[WiiM] Config entry for %s already exists. Skipping import.", ip)
                 continue
 
             # If we're the master of the current group, force the slave to leave
@@ -480,27 +638,26 @@ class WiiMCoordinator(DataUpdateCoordinator):
             except Exception as kick_err:
                 _LOGGER.debug("[WiiM] Failed to kick slave %s: %s (continuing import)", ip, kick_err)
 
-            # Prevent duplicate config-entries: skip if another entry already
-            # has the same host (even if its unique_id differs for legacy
-            # reasons or the entry is not fully set up yet)
-            for entry in self.hass.config_entries.async_entries(DOMAIN):
-                if entry.data.get(CONF_HOST) == ip:
-                    _LOGGER.debug("[WiiM] Config entry for %s already exists (%s). Skipping import.", ip, entry.entry_id)
-                    self._imported_hosts.add(ip)
-                    break
-            else:
-                # Only start a flow if no existing entry with this host
-                self.hass.async_create_task(
-                    self.hass.config_entries.flow.async_init(
-                        DOMAIN,
-                        context={"source": "import"},
-                        data={CONF_HOST: ip},
-                    )
-                )
-                _LOGGER.debug("Started import flow for slave %s", ip)
-
-            # Mark as processed to avoid future duplicate attempts
-            self._imported_hosts.add(ip)
+            self.hass.async_create_task(self._async_import_slave(ip))
+            _LOGGER.debug("Started import flow for slave %s", ip)
+
+    async def _async_import_slave(self, ip: str) -> None:
+        """Run the import flow for *ip*, capped so bursts don't swamp HA."""
+        semaphore = self.hass.data.setdefault(DOMAIN, {}).get(_IMPORT_FLOW_SEMAPHORE_KEY)
+        if semaphore is None:
+            semaphore = self.hass.data[DOMAIN][_IMPORT_FLOW_SEMAPHORE_KEY] = asyncio.Semaphore(
+                _MAX_CONCURRENT_IMPORT_FLOWS
+            )
+        async with semaphore:
+            await self.hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": "import"},
+                data={CONF_HOST: ip},
+            )
+
+    # The group actions below schedule the follow-up refresh instead of
+    # awaiting it, so the service call returns as soon as the device has
+    # accepted the command.
 
     async def create_wiim_group(self) -> None:
         """Create a WiiM multiroom group."""
@@ -508,7 +665,7 @@ class WiiMCoordinator(DataUpdateCoordinator):
             _LOGGER.info("[WiiM] Coordinator: Creating new WiiM group for %s", self.client.host)
             await self.client.create_group()
             _LOGGER.info("[WiiM] Coordinator: Successfully created WiiM group for %s", self.client.host)
-            await self.async_refresh()
+            self.hass.async_create_task(self.async_refresh())
         except WiiMError as err:
             _LOGGER.error("[WiiM] Coordinator: Failed to create WiiM group for %s: %s", self.client.host, err)
             raise
@@ -519,7 +676,7 @@ class WiiMCoordinator(DataUpdateCoordinator):
             _LOGGER.info("[WiiM] Coordinator: Deleting WiiM group for %s", self.client.host)
             await self.client.delete_group()
             _LOGGER.info("[WiiM] Coordinator: Successfully deleted WiiM group for %s", self.client.host)
-            await self.async_refresh()
+            self.hass.async_create_task(self.async_refresh())
         except WiiMError as err:
             _LOGGER.error("[WiiM] Coordinator: Failed to delete WiiM group for %s: %s", self.client.host, err)
             raise
@@ -530,7 +687,7 @@ class WiiMCoordinator(DataUpdateCoordinator):
             _LOGGER.info("[WiiM] Coordinator: %s joining WiiM group with master %s", self.client.host, master_ip)
             await self.client.join_group(master_ip)
             _LOGGER.info("[WiiM] Coordinator: %s successfully joined WiiM group with master %s", self.client.host, master_ip)
-            await self.async_refresh()
+            self.hass.async_create_task(self.async_refresh())
         except WiiMError as err:
             _LOGGER.error("[WiiM] Coordinator: %s failed to join WiiM group with master %s: %s", self.client.host, master_ip, err)
             raise
@@ -541,7 +698,7 @@ class WiiMCoordinator(DataUpdateCoordinator):
             _LOGGER.info("[WiiM] Coordinator: %s leaving WiiM group", self.client.host)
             await self.client.leave_group()
             _LOGGER.info("[WiiM] Coordinator: %s successfully left WiiM group", self.client.host)
-            await self.async_refresh()
+            self.hass.async_create_task(self.async_refresh())
         except WiiMError as err:
             _LOGGER.error("[WiiM] Coordinator: %s failed to leave WiiM group: %s", self.client.host, err)
             raise
@@ -557,7 +714,7 @@ class WiiMCoordinator(DataUpdateCoordinator):
         return self.client.is_slave
 
     @property
-    def wiim_group_members(self) -> set[str]:
+    def wiim_group_members(self) -> frozenset[str]:
         """Return set of WiiM group member IPs."""
         return self._group_members
 
@@ -567,7 +724,7 @@ class WiiMCoordinator(DataUpdateCoordinator):
         return self._is_ha_group_leader
 
     @property
-    def ha_group_members(self) -> set[str]:
+    def ha_group_members(self) -> frozenset[str]:
         """Return set of HA group member entity IDs."""
         return self._ha_group_members
 
@@ -595,16 +752,12 @@ class WiiMCoordinator(DataUpdateCoordinator):
     def friendly_name(self) -> str:
         """Return a human-friendly name for the device.
 
-        Prefer the HTTP-API field ``device_name`` (normalised) or the raw
-        ``DeviceName`` if present; otherwise fall back to the host.
+        Prefer the HTTP-API field ``device_name`` (``DeviceName`` is
+        normalised by the client); otherwise fall back to the host.
         """
 
-        status = self.data.get("status", {}) if isinstance(self.data, dict) else {}
-        return (
-            status.get("device_name")
-            or status.get("DeviceName")  # legacy field – shouldn't exist now
-            or self.client.host
-        )
+        status = self.data.get("status", {})
+        return status.get("device_name") or self.client.host
 
     # ---------------------------------------------------------------------
     # Compatibility helpers (used by Number entities) ---------------------
@@ -636,3 +789,33 @@ class WiiMCoordinator(DataUpdateCoordinator):
             self._schedule_refresh()  # type: ignore[attr-defined]
         # Trigger an immediate refresh so listeners get up-to-date data
         await self.async_refresh()
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the device-registry identity shared by all entities.
+
+        Rebuilt only when the name, model, firmware or MAC reported by the
+        device changes, so every platform hands Home Assistant the same
+        object for this speaker while still picking up renames and firmware
+        updates.
+        """
+
+        status = self.data.get("status", {})
+        key = (
+            self.friendly_name,
+            status.get("hardware") or status.get("project"),
+            status.get("firmware"),
+            status.get("MAC"),
+        )
+        if key != self._device_info_key:
+            name, model, firmware, mac = key
+            self._device_info_key = key
+            self._device_info = DeviceInfo(
+                identifiers={(DOMAIN, self.client.host)},
+                name=name,
+                manufacturer="WiiM",
+                model=model,
+                sw_version=firmware,
+                connections={("mac", mac)} if mac else set(),
+            )
+        return self._device_info
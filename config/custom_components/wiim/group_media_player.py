@@ -1,9 +1,31 @@
 from homeassistant.components.media_player import MediaPlayerEntity, MediaPlayerState, MediaPlayerEntityFeature
-from .const import DOMAIN
+from homeassistant.core import callback
+from homeassistant.exceptions import HomeAssistantError
+from .const import DATA_COORDINATORS_BY_IP
+import asyncio
 import logging
 
 _LOGGER = logging.getLogger(__name__)
 
+# Raw LinkPlay play_status values (and already-mapped HA states) per state.
+_PLAYING_STATES = frozenset({"play", MediaPlayerState.PLAYING})
+_PAUSED_STATES = frozenset({"pause", MediaPlayerState.PAUSED})
+
+# Feature mask shared by every group entity, built once at import.
+_GROUP_FEATURES = (
+    MediaPlayerEntityFeature.PLAY
+    | MediaPlayerEntityFeature.PAUSE
+    | MediaPlayerEntityFeature.STOP
+    | MediaPlayerEntityFeature.NEXT_TRACK
+    | MediaPlayerEntityFeature.PREVIOUS_TRACK
+    | MediaPlayerEntityFeature.VOLUME_SET
+    | MediaPlayerEntityFeature.VOLUME_MUTE
+    | MediaPlayerEntityFeature.GROUPING
+)
+
+# One-pass character mapping used to build the group's unique_id slug.
+_SLUG_TABLE = str.maketrans({' ': '_', '(': '', ')': '', ',': '', '.': '_'})
+
 class WiiMGroupMediaPlayer(MediaPlayerEntity):
     """Representation of a WiiM group media player entity.
 
@@ -46,32 +68,29 @@ class WiiMGroupMediaPlayer(MediaPlayerEntity):
         if not group_name or group_name.strip().lower() in ("wiim group", "none", "null", ""):
             group_name = f"WiiM Group {master_ip}"
         safe_name = (
-            group_name.replace(' ', '_')
-            .replace('(', '')
-            .replace(')', '')
-            .replace(',', '')
-            .replace('.', '_')
+            group_name.translate(_SLUG_TABLE)
             .replace('none', '')
             .replace('null', '')
             .lower()
         )
         self._attr_unique_id = f"wiim_group_{safe_name}"
+        self._attr_keys_by_ip = {}
+        self._attrs_cache = None
+        self._master_coord = None
+        self._group_info_cache = None
+        self._metrics_key = None
+        self._metrics = (0, None)
         self._attr_name = f"{group_name} (Group)"
-        self._attr_supported_features = (
-            MediaPlayerEntityFeature.PLAY
-            | MediaPlayerEntityFeature.PAUSE
-            | MediaPlayerEntityFeature.STOP
-            | MediaPlayerEntityFeature.NEXT_TRACK
-            | MediaPlayerEntityFeature.PREVIOUS_TRACK
-            | MediaPlayerEntityFeature.VOLUME_SET
-            | MediaPlayerEntityFeature.VOLUME_MUTE
-            | MediaPlayerEntityFeature.GROUPING
-        )
+        self._attr_supported_features = _GROUP_FEATURES
 
     @property
     def group_info(self):
-        info = self.coordinator.get_group_by_master(self.master_ip) or {}
-        _LOGGER.debug("[WiiMGroup] Group info for master %s: %s", self.master_ip, info)
+        # Resolved once per coordinator update; see _handle_coordinator_update
+        info = self._group_info_cache
+        if info is None:
+            info = self._group_info_cache = self.coordinator.get_group_by_master(self.master_ip) or {}
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug("[WiiMGroup] Group info for master %s: %s", self.master_ip, info)
         return info
 
     @property
@@ -85,37 +104,32 @@ class WiiMGroupMediaPlayer(MediaPlayerEntity):
     @property
     def state(self):
         # Get master's state directly from its coordinator
-        master_coord = self._find_coordinator_by_ip(self.master_ip)
+        master_coord = self._get_master()
         if not master_coord:
             _LOGGER.warning("[WiiMGroup] No coordinator found for master %s in group %s", self.master_ip, self._attr_name)
             return MediaPlayerState.IDLE
 
-        status = master_coord.data.get("status", {})
-        role = master_coord.data.get("role")
-        _LOGGER.debug(
-            "[WiiMGroup] Master %s state check - role=%s, status=%s",
-            self.master_ip, role, status
-        )
+        data = master_coord.data
+        status = data.get("status") or {}
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "[WiiMGroup] Master %s state check - role=%s, status=%s",
+                self.master_ip, data.get("role"), status
+            )
 
         if not status.get("power"):
             return MediaPlayerState.OFF
-        if status.get("play_status") == "play":
+        play_status = status.get("play_status")
+        if play_status in _PLAYING_STATES:
             return MediaPlayerState.PLAYING
-        if status.get("play_status") == "pause":
+        if play_status in _PAUSED_STATES:
             return MediaPlayerState.PAUSED
         return MediaPlayerState.IDLE
 
     @property
     def volume_level(self):
-        # Always get the latest volume from each coordinator
-        max_vol = 0
-        for ip in self.group_members:
-            coord = self._find_coordinator_by_ip(ip)
-            if coord and coord.data and "status" in coord.data:
-                vol = coord.data["status"].get("volume", 0)
-                if vol > max_vol:
-                    max_vol = vol
-        return float(max_vol) / 100
+        # Loudest member sets the group volume
+        return float(self._member_metrics()[0]) / 100
 
     @property
     def is_volume_muted(self):
@@ -126,106 +140,106 @@ class WiiMGroupMediaPlayer(MediaPlayerEntity):
         speaker is un-muted the group reports `False` so clicking the icon in
         the UI will try to mute all.
         """
+        return self._member_metrics()[1]
 
-        any_unmuted = False
-        any_known = False
-        for ip in self.group_members:
-            coord = self._find_coordinator_by_ip(ip)
-            if not coord or "status" not in coord.data:
-                continue
-            any_known = True
-            if not coord.data["status"].get("mute", False):
-                any_unmuted = True
-                break
+    def _member_metrics(self):
+        """Return ``(max_volume, muted)`` over all members in a single walk.
 
-        if not any_known:
-            return None  # Unknown
-        return not any_unmuted
+        Cached until a member coordinator publishes a new ``data`` dict; the
+        cache holds the dicts themselves so identity checks stay valid.
+        """
+        by_ip = self.hass.data.get(DATA_COORDINATORS_BY_IP, {})
+        datas = tuple(
+            coord.data if (coord := by_ip.get(ip)) else None
+            for ip in self.group_members
+        )
+        cached = self._metrics_key
+        if cached is not None and len(cached) == len(datas) and all(
+            a is b for a, b in zip(cached, datas)
+        ):
+            return self._metrics
+
+        statuses = [data["status"] for data in datas if data and "status" in data]
+        max_vol = max((status.get("volume", 0) for status in statuses), default=0)
+        # Mute is unknown (None) when no member has reported status yet
+        muted = all(status.get("mute", False) for status in statuses) if statuses else None
+
+        self._metrics_key = datas
+        self._metrics = (max_vol, muted)
+        return self._metrics
 
     @property
     def extra_state_attributes(self):
-        # Expose per-slave volume/mute
-        attrs = {}
-        for ip, m in self.group_info.get("members", {}).items():
-            attrs[f"member_{ip}_volume"] = m.get("volume")
-            attrs[f"member_{ip}_mute"] = m.get("mute")
-            attrs[f"member_{ip}_name"] = m.get("name")
+        # Expose per-slave volume/mute; built once per coordinator update
+        # (the cache is dropped in _handle_coordinator_update).
+        attrs = self._attrs_cache
+        if attrs is None:
+            attrs = self._attrs_cache = {}
+            for ip, member in self.group_info.get("members", {}).items():
+                vol_key, mute_key, name_key = self._member_attr_keys(ip)
+                attrs[vol_key] = member.get("volume")
+                attrs[mute_key] = member.get("mute")
+                attrs[name_key] = member.get("name")
         return attrs
 
-    @property
-    def supported_features(self):
-        return self._attr_supported_features
+    def _member_attr_keys(self, ip):
+        """Return the (volume, mute, name) attribute keys for member *ip*."""
+        keys = self._attr_keys_by_ip.get(ip)
+        if keys is None:
+            keys = self._attr_keys_by_ip[ip] = (
+                f"member_{ip}_volume",
+                f"member_{ip}_mute",
+                f"member_{ip}_name",
+            )
+        return keys
+
+    def _master_status_field(self, key, log_missing=False):
+        """Return *key* from the master's status, or None without a master."""
+        master_coord = self._get_master()
+        if not master_coord:
+            if log_missing:
+                _LOGGER.debug("[WiiMGroup] No coordinator found for master %s in group %s", self.master_ip, self._attr_name)
+            return None
+        status = master_coord.data.get("status") or {}
+        value = status.get(key)
+        if log_missing and not value and _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug("[WiiMGroup] No %s for master %s in group %s: %s", key, self.master_ip, self._attr_name, status)
+        return value
 
     @property
     def entity_picture(self):
-        master_coord = self._find_coordinator_by_ip(self.master_ip)
-        if not master_coord:
-            _LOGGER.debug("[WiiMGroup] No coordinator found for master %s in group %s", self.master_ip, self._attr_name)
-            return None
-        pic = master_coord.data.get("status", {}).get("entity_picture")
-        if not pic:
-            _LOGGER.debug("[WiiMGroup] No entity_picture for master %s in group %s: %s", self.master_ip, self._attr_name, master_coord.data.get("status", {}))
-        return pic
+        return self._master_status_field("entity_picture", log_missing=True)
 
     @property
     def media_title(self):
-        master_coord = self._find_coordinator_by_ip(self.master_ip)
-        if not master_coord:
-            _LOGGER.debug("[WiiMGroup] No coordinator found for master %s in group %s", self.master_ip, self._attr_name)
-            return None
-        title = master_coord.data.get("status", {}).get("title")
-        if not title:
-            _LOGGER.debug("[WiiMGroup] No media_title for master %s in group %s: %s", self.master_ip, self._attr_name, master_coord.data.get("status", {}))
-        return title
+        return self._master_status_field("title", log_missing=True)
 
     @property
     def media_artist(self):
-        master_coord = self._find_coordinator_by_ip(self.master_ip)
-        if not master_coord:
-            _LOGGER.debug("[WiiMGroup] No coordinator found for master %s in group %s", self.master_ip, self._attr_name)
-            return None
-        artist = master_coord.data.get("status", {}).get("artist")
-        if not artist:
-            _LOGGER.debug("[WiiMGroup] No media_artist for master %s in group %s: %s", self.master_ip, self._attr_name, master_coord.data.get("status", {}))
-        return artist
+        return self._master_status_field("artist", log_missing=True)
 
     @property
     def media_album_name(self):
-        master_coord = self._find_coordinator_by_ip(self.master_ip)
-        if not master_coord:
-            _LOGGER.debug("[WiiMGroup] No coordinator found for master %s in group %s", self.master_ip, self._attr_name)
-            return None
-        album = master_coord.data.get("status", {}).get("album")
-        if not album:
-            _LOGGER.debug("[WiiMGroup] No media_album_name for master %s in group %s: %s", self.master_ip, self._attr_name, master_coord.data.get("status", {}))
-        return album
+        return self._master_status_field("album", log_missing=True)
 
     @property
     def media_position(self):
-        master_coord = self._find_coordinator_by_ip(self.master_ip)
-        if master_coord:
-            return master_coord.data.get("status", {}).get("position")
-        return None
+        return self._master_status_field("position")
 
     @property
     def media_duration(self):
-        master_coord = self._find_coordinator_by_ip(self.master_ip)
-        if master_coord:
-            return master_coord.data.get("status", {}).get("duration")
-        return None
+        return self._master_status_field("duration")
 
     @property
     def media_position_updated_at(self):
-        master_coord = self._find_coordinator_by_ip(self.master_ip)
-        if master_coord:
-            return master_coord.data.get("status", {}).get("position_updated_at")
-        return None
+        return self._master_status_field("position_updated_at")
 
     async def async_set_volume_level(self, volume):
         # Always get the latest volume from each coordinator
+        coords = self._member_coordinators()
         member_vols = {}
         for ip in self.group_members:
-            coord = self._find_coordinator_by_ip(ip)
+            coord = coords.get(ip)
             if coord and coord.data and "status" in coord.data:
                 member_vols[ip] = coord.data["status"].get("volume", 0)
             else:
@@ -235,11 +249,14 @@ class WiiMGroupMediaPlayer(MediaPlayerEntity):
         current_max = max(member_vols.values())
         new_max = int(volume * 100)
         delta = new_max - current_max
-        for ip, cur in member_vols.items():
-            new_vol = max(0, min(100, cur + delta))
-            coord = self._find_coordinator_by_ip(ip)
-            if coord:
-                await coord.client.set_volume(new_vol / 100)
+        await self._run_on_members(
+            "set_volume",
+            {
+                ip: coords[ip].client.set_volume(max(0, min(100, cur + delta)) / 100)
+                for ip, cur in member_vols.items()
+                if ip in coords
+            },
+        )
 
     async def async_mute_volume(self, mute: bool):
         """Mute or unmute the entire group.
@@ -257,46 +274,42 @@ class WiiMGroupMediaPlayer(MediaPlayerEntity):
         # setPlayerCmd:mute command.  Slaves accept it just fine and this keeps
         # behaviour symmetrical.
 
-        for ip in self.group_members:
-            coord = self._find_coordinator_by_ip(ip)
-            if not coord:
-                continue
-            try:
-                await coord.client.set_mute(mute)
-            except Exception as err:  # noqa: BLE001
-                _LOGGER.debug("[WiiMGroup] Failed to set mute=%s on %s: %s", mute, ip, err)
-
-        # Trigger an *immediate* refresh for every coordinator so the updated
-        # mute state becomes visible without waiting for the next poll.
-        for ip in self.group_members:
-            coord = self._find_coordinator_by_ip(ip)
-            if coord:
-                try:
-                    await coord.async_request_refresh()  # type: ignore[attr-defined]
-                except Exception:  # noqa: BLE001 – best-effort
-                    pass
-
-        # Finally update our own HA state so the UI reflects the new aggregate
-        # mute status right away.
-        self.async_write_ha_state()
+        coords = self._member_coordinators()
+        try:
+            await self._run_on_members(
+                f"set_mute={mute}",
+                {ip: coord.client.set_mute(mute) for ip, coord in coords.items()},
+            )
+        finally:
+            # Even after a partial failure, trigger an *immediate* refresh
+            # for every coordinator so the members that did change show
+            # their new mute state without waiting for the next poll.
+            await asyncio.gather(
+                *(coord.async_request_refresh() for coord in coords.values()),
+                return_exceptions=True,
+            )
+
+            # Finally update our own HA state so the UI reflects the new
+            # aggregate mute status right away.
+            self.async_write_ha_state()
 
     async def async_media_play(self):
         # Play on all members
-        for ip in self.group_members:
-            coord = self._find_coordinator_by_ip(ip)
-            if coord:
-                await coord.client.play()
+        await self._run_on_members(
+            "play",
+            {ip: coord.client.play() for ip, coord in self._member_coordinators().items()},
+        )
 
     async def async_media_pause(self):
         # Pause on all members
-        for ip in self.group_members:
-            coord = self._find_coordinator_by_ip(ip)
-            if coord:
-                await coord.client.pause()
+        await self._run_on_members(
+            "pause",
+            {ip: coord.client.pause() for ip, coord in self._member_coordinators().items()},
+        )
 
     async def async_media_next_track(self):
         """Send next track command to the group master only."""
-        master_coord = self._find_coordinator_by_ip(self.master_ip)
+        master_coord = self._get_master()
         if master_coord:
             await master_coord.client.next_track()
         else:
@@ -304,25 +317,72 @@ class WiiMGroupMediaPlayer(MediaPlayerEntity):
 
     async def async_media_previous_track(self):
         """Send previous track command to the group master only."""
-        master_coord = self._find_coordinator_by_ip(self.master_ip)
+        master_coord = self._get_master()
         if master_coord:
             await master_coord.client.previous_track()
         else:
             _LOGGER.warning("[WiiMGroup] No coordinator found for master %s when trying to send previous_track", self.master_ip)
 
+    def _get_master(self):
+        """Return the master's coordinator, resolved once and then reused.
+
+        The entity is removed when the master's entry unloads, so the cached
+        coordinator cannot go stale; a miss (master not set up yet) is not
+        cached.
+        """
+        coord = self._master_coord
+        if coord is None:
+            coord = self._master_coord = self._find_coordinator_by_ip(self.master_ip)
+        return coord
+
+    async def async_added_to_hass(self):
+        self.async_on_remove(self.coordinator.async_add_listener(self._handle_coordinator_update))
+
+    @callback
+    def _handle_coordinator_update(self):
+        """Drop per-update caches and publish the refreshed group state."""
+        self._group_info_cache = None
+        self._attrs_cache = None
+        self.async_write_ha_state()
+
+    async def async_will_remove_from_hass(self):
+        self._master_coord = None
+
     def _find_coordinator_by_ip(self, ip):
-        # Helper to find coordinator by IP
-        for coord in self.hass.data[DOMAIN].values():
-            # Skip any non-coordinator entries that may have been added to hass.data[DOMAIN]
-            if not hasattr(coord, "client"):
-                continue
-            if coord.client.host == ip:
-                role = coord.data.get("role")
-                multiroom = coord.data.get("multiroom", {})
-                _LOGGER.debug(
-                    "[WiiMGroup] Found coordinator for %s: role=%s, multiroom=%s, data=%s",
-                    ip, role, multiroom, coord.data
-                )
-                return coord
-        _LOGGER.debug("[WiiMGroup] No coordinator found for IP %s (likely not yet set up)", ip)
-        return None
\ No newline at end of file
+        # O(1) lookup in the host → coordinator index kept by __init__.py
+        coord = self.hass.data.get(DATA_COORDINATORS_BY_IP, {}).get(ip)
+        if coord is None:
+            _LOGGER.debug("[WiiMGroup] No coordinator found for IP %s (likely not yet set up)", ip)
+            return None
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "[WiiMGroup] Found coordinator for %s: role=%s, multiroom=%s, data=%s",
+                ip, coord.data.get("role"), coord.data.get("multiroom", {}), coord.data
+            )
+        return coord
+
+    async def _run_on_members(self, action, calls):
+        """Await per-member commands concurrently, logging failures per device.
+
+        Group commands overlap their network round-trips instead of paying
+        for each speaker in turn; one unreachable member does not stop the
+        others from receiving the command.  Raises HomeAssistantError naming
+        the failed members once all calls have completed.
+        """
+        results = await asyncio.gather(*calls.values(), return_exceptions=True)
+        failed = []
+        for ip, result in zip(calls, results):
+            if isinstance(result, Exception):
+                _LOGGER.warning("[WiiMGroup] %s failed on %s: %s", action, ip, result)
+                failed.append(ip)
+        if failed:
+            raise HomeAssistantError(f"Group {action} failed on {', '.join(failed)}")
+
+    def _member_coordinators(self):
+        """Resolve every member's coordinator once for a whole command."""
+        members = {}
+        for ip in self.group_members:
+            coord = self._find_coordinator_by_ip(ip)
+            if coord:
+                members[ip] = coord
+        return members
@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import logging
+from collections.abc import Awaitable, Mapping
+from types import MappingProxyType
 from typing import Any
 import asyncio
 
@@ -12,7 +14,7 @@ from homeassistant.components.media_player import (
     MediaPlayerState,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -37,14 +39,14 @@ from .const import (
     ATTR_REPEAT_MODE,
     ATTR_SHUFFLE_MODE,
     ATTR_SOURCE,
+    DATA_COORDINATORS_BY_ENTITY_ID,
+    DATA_COORDINATORS_BY_IP,
     DOMAIN,
     PLAY_MODE_NORMAL,
     PLAY_MODE_REPEAT_ALL,
     PLAY_MODE_REPEAT_ONE,
     PLAY_MODE_SHUFFLE,
     PLAY_MODE_SHUFFLE_REPEAT_ALL,
-    CONF_VOLUME_STEP,
-    DEFAULT_VOLUME_STEP,
     EQ_PRESET_CUSTOM,
     EQ_PRESET_MAP,
     SOURCE_MAP,
@@ -55,6 +57,40 @@ from .group_media_player import WiiMGroupMediaPlayer
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only stand-in for a missing status dict, so property reads
+# don't allocate a fresh ``{}`` on every miss.
+_EMPTY: Mapping[str, Any] = MappingProxyType({})
+
+# play_mode → (shuffle, repeat) as exposed to HA; "normal"/unknown is neither.
+_PLAY_MODE_FLAGS: dict[str, tuple[bool, str]] = {
+    PLAY_MODE_SHUFFLE: (True, "off"),
+    PLAY_MODE_SHUFFLE_REPEAT_ALL: (True, "all"),
+    PLAY_MODE_REPEAT_ALL: (False, "all"),
+    PLAY_MODE_REPEAT_ONE: (False, "one"),
+}
+_DEFAULT_PLAY_MODE_FLAGS = (False, "off")
+
+# Features every WiiM speaker supports; source and sound-mode selection are
+# added per device in WiiMMediaPlayer.__init__.
+_BASE_FEATURES = (
+    MediaPlayerEntityFeature.PLAY
+    | MediaPlayerEntityFeature.PAUSE
+    | MediaPlayerEntityFeature.STOP
+    | MediaPlayerEntityFeature.NEXT_TRACK
+    | MediaPlayerEntityFeature.PREVIOUS_TRACK
+    | MediaPlayerEntityFeature.VOLUME_SET
+    | MediaPlayerEntityFeature.VOLUME_MUTE
+    | MediaPlayerEntityFeature.PLAY_MEDIA
+    | MediaPlayerEntityFeature.BROWSE_MEDIA
+    | MediaPlayerEntityFeature.GROUPING
+)
+
+# LinkPlay play_status → HA state; anything else ("stop", unknown) is idle.
+_STATE_MAP = {
+    "play": MediaPlayerState.PLAYING,
+    "pause": MediaPlayerState.PAUSED,
+}
+
 # Home Assistant doesn't define a constant for the leader attribute.
 HA_ATTR_GROUP_LEADER = "group_leader"
 
@@ -65,7 +101,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up WiiM media player from a config entry."""
-    coordinator = hass.data[DOMAIN][config_entry.entry_id]
+    coordinator = config_entry.runtime_data
     entity = WiiMMediaPlayer(coordinator)
 
     async_add_entities([entity])
@@ -189,28 +225,8 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     def __init__(self, coordinator: WiiMCoordinator) -> None:
         """Initialize the WiiM media player."""
         super().__init__(coordinator)
-        status = coordinator.data.get("status", {})
         self._attr_unique_id = coordinator.client.host
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.client.host)},
-            name=status.get("DeviceName") or status.get("device_name") or coordinator.client.host,
-            manufacturer="WiiM",
-            model=status.get("hardware") or status.get("project"),
-            sw_version=status.get("firmware"),
-            connections={("mac", status.get("MAC"))} if status.get("MAC") else set(),
-        )
-        base_features = (
-            MediaPlayerEntityFeature.PLAY
-            | MediaPlayerEntityFeature.PAUSE
-            | MediaPlayerEntityFeature.STOP
-            | MediaPlayerEntityFeature.NEXT_TRACK
-            | MediaPlayerEntityFeature.PREVIOUS_TRACK
-            | MediaPlayerEntityFeature.VOLUME_SET
-            | MediaPlayerEntityFeature.VOLUME_MUTE
-            | MediaPlayerEntityFeature.PLAY_MEDIA
-            | MediaPlayerEntityFeature.BROWSE_MEDIA
-            | MediaPlayerEntityFeature.GROUPING
-        )
+        base_features = _BASE_FEATURES
 
         # Add optional selectors only if the coordinator reports support
         if coordinator.source_supported:
@@ -219,6 +235,8 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             base_features |= MediaPlayerEntityFeature.SELECT_SOUND_MODE
 
         self._attr_supported_features = base_features
+        self._attrs_key: tuple | None = None
+        self._attrs: dict[str, Any] = {}
         _LOGGER.debug(
             "WiiM %s: supported_features bitmask = %s (type: %s, enum: %s)",
             coordinator.client.host,
@@ -227,25 +245,41 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             MediaPlayerEntityFeature,
         )
 
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the speaker's current device-registry identity."""
+        return self.coordinator.device_info
+
+    async def async_added_to_hass(self) -> None:
+        """Register in the entity_id index used by join/unjoin lookups."""
+        await super().async_added_to_hass()
+        self.hass.data.setdefault(DATA_COORDINATORS_BY_ENTITY_ID, {})[self.entity_id] = self.coordinator
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Drop this entity from the entity_id index."""
+        by_entity_id = self.hass.data.get(DATA_COORDINATORS_BY_ENTITY_ID, {})
+        if by_entity_id.get(self.entity_id) is self.coordinator:
+            del by_entity_id[self.entity_id]
+        await super().async_will_remove_from_hass()
+
+    @property
+    def _status(self) -> Mapping[str, Any]:
+        """Return this device's own parsed status (never None)."""
+        return self.coordinator.data.get("status") or _EMPTY
+
     @property
     def name(self) -> str:
         """Return the name of the entity, always using the latest device name from status."""
-        status = self.coordinator.data.get("status", {})
-        return status.get("DeviceName") or status.get("device_name") or self.coordinator.client.host
+        status = self._status
+        return status.get("device_name") or self.coordinator.client.host
 
     @property
     def state(self) -> MediaPlayerState:
         """Return the state of the device."""
-        status = self._effective_status() or {}
+        status = self._effective_status() or _EMPTY
         play_status = status.get("play_status")
         _LOGGER.debug("[WiiM] %s: state property, play_status=%s", self.coordinator.client.host, play_status)
-        if play_status == "play":
-            return MediaPlayerState.PLAYING
-        if play_status == "pause":
-            return MediaPlayerState.PAUSED
-        if play_status == "stop":
-            return MediaPlayerState.IDLE
-        return MediaPlayerState.IDLE
+        return _STATE_MAP.get(play_status, MediaPlayerState.IDLE)
 
     @property
     def volume_level(self) -> float | None:
@@ -257,7 +291,7 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         # back to the volume that the *master* advertises for us in its
         # ``multiroom:slave_list`` payload.
 
-        status_volume: int | None = self.coordinator.data.get("status", {}).get("volume")
+        status_volume: int | None = self._status.get("volume")
 
         # Early-exit for normal (solo or master) speakers – their own status
         # is considered authoritative.
@@ -286,7 +320,7 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         role = self.coordinator.data.get("role")
         # For *solo* and *master* devices the local status is authoritative.
         if role != "slave":
-            return self.coordinator.data.get("status", {}).get("mute")
+            return self._status.get("mute")
 
         # --- Slave path ----------------------------------------------------
         master_coord = self._find_master_coordinator()
@@ -299,7 +333,7 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
 
         # Fallback – may be *None* if the key is missing which Home-Assistant
         # will interpret as *unknown*.
-        return self.coordinator.data.get("status", {}).get("mute")
+        return self._status.get("mute")
 
     def _effective_status(self):
         role = self.coordinator.data.get("role")
@@ -308,10 +342,16 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             master_id = self.coordinator.client.group_master
             multiroom = self.coordinator.data.get("multiroom", {})
             my_ip = self.coordinator.client.host
-            my_uuid = self.coordinator.data.get("status", {}).get("device_id")
+            my_uuid = self._status.get("device_id")
             _LOGGER.debug("[WiiM] Slave %s: group_master=%s, multiroom=%s, my_ip=%s, my_uuid=%s", self.coordinator.client.host, master_id, multiroom, my_ip, my_uuid)
             # If group_master is set, try to match by IP or UUID
             if master_id:
+                coord = self.hass.data.get(DATA_COORDINATORS_BY_IP, {}).get(master_id)
+                if coord is not None:
+                    status = coord.data.get("status", {})
+                    _LOGGER.debug("[WiiM] Slave %s: mirroring master's status by ip: %s", self.coordinator.client.host, status)
+                    return status
+                # Not an IP we know – the master may be identified by UUID
                 for coord in self.hass.data[DOMAIN].values():
                     if not hasattr(coord, "client"):
                         continue
@@ -351,10 +391,7 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             if potential_master and isinstance(potential_master, str) and "." in potential_master:
                 master_ip = potential_master
                 # Check if we already have a coordinator for that IP
-                if not any(
-                    hasattr(c, "client") and c.client.host == master_ip
-                    for c in self.hass.data.get(DOMAIN, {}).values()
-                ):
+                if master_ip not in self.hass.data.get(DATA_COORDINATORS_BY_IP, {}):
                     _LOGGER.debug("[WiiM] Slave %s: launching import flow for unknown master %s", self.coordinator.client.host, master_ip)
                     # Schedule without awaiting – running inside property getter
                     self.hass.async_create_task(
@@ -366,14 +403,14 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
                     )
             return {}
         # Not a slave: return own status
-        status = self.coordinator.data.get("status", {})
+        status = self._status
         _LOGGER.debug("[WiiM] %s: returning own status: %s", self.coordinator.client.host, status)
         return status
 
     @property
     def media_title(self) -> str | None:
         """Return the title of current playing media."""
-        status = self._effective_status() or {}
+        status = self._effective_status() or _EMPTY
         title = status.get("title")
         _LOGGER.debug("[WiiM] %s: media_title=%s", self.coordinator.client.host, title)
         return None if title in ("unknow", "unknown", None) else title
@@ -381,7 +418,7 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     @property
     def media_artist(self) -> str | None:
         """Return the artist of current playing media."""
-        status = self._effective_status() or {}
+        status = self._effective_status() or _EMPTY
         artist = status.get("artist")
         _LOGGER.debug("[WiiM] %s: media_artist=%s", self.coordinator.client.host, artist)
         return None if artist in ("unknow", "unknown", None) else artist
@@ -389,7 +426,7 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     @property
     def media_album_name(self) -> str | None:
         """Return the album name of current playing media."""
-        status = self._effective_status() or {}
+        status = self._effective_status() or _EMPTY
         album = status.get("album")
         _LOGGER.debug("[WiiM] %s: media_album_name=%s", self.coordinator.client.host, album)
         return None if album in ("unknow", "unknown", None) else album
@@ -397,7 +434,7 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     @property
     def media_position(self) -> int | None:
         """Position of current playing media in seconds."""
-        status = self._effective_status() or {}
+        status = self._effective_status() or _EMPTY
         pos = status.get("position")
         _LOGGER.debug("[WiiM] %s: media_position=%s", self.coordinator.client.host, pos)
         return pos
@@ -405,7 +442,7 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     @property
     def media_position_updated_at(self) -> float | None:
         """When was the position of the current playing media valid."""
-        status = self._effective_status() or {}
+        status = self._effective_status() or _EMPTY
         updated = status.get("position_updated_at")
         _LOGGER.debug("[WiiM] %s: media_position_updated_at=%s", self.coordinator.client.host, updated)
         return updated
@@ -413,7 +450,7 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     @property
     def media_duration(self) -> int | None:
         """Duration of current playing media in seconds."""
-        status = self._effective_status() or {}
+        status = self._effective_status() or _EMPTY
         dur = status.get("duration")
         _LOGGER.debug("[WiiM] %s: media_duration=%s", self.coordinator.client.host, dur)
         return dur
@@ -421,22 +458,20 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     @property
     def shuffle(self) -> bool | None:
         """Return true if shuffle is enabled."""
-        mode = self.coordinator.data.get("status", {}).get("play_mode")
-        return mode in (PLAY_MODE_SHUFFLE, PLAY_MODE_SHUFFLE_REPEAT_ALL)
+        return self._play_mode_flags()[0]
 
     @property
     def repeat(self) -> str | None:
         """Return current repeat mode."""
-        mode = self.coordinator.data.get("status", {}).get("play_mode")
-        if mode == PLAY_MODE_REPEAT_ONE:
-            return "one"
-        if mode in (PLAY_MODE_REPEAT_ALL, PLAY_MODE_SHUFFLE_REPEAT_ALL):
-            return "all"
-        return "off"
+        return self._play_mode_flags()[1]
+
+    def _play_mode_flags(self) -> tuple[bool, str]:
+        """Return ``(shuffle, repeat)`` decoded from the current play mode."""
+        return _PLAY_MODE_FLAGS.get(self._status.get("play_mode"), _DEFAULT_PLAY_MODE_FLAGS)
 
     @property
     def source_list(self) -> list[str]:
-        sources = self.coordinator.data.get("status", {}).get("sources", [])
+        sources = self._status.get("sources", [])
         _LOGGER.debug("[WiiM] %s source_list raw sources: %s", self.entity_id, sources)
         mapped_sources = [SOURCE_MAP.get(src, src.title()) for src in sources]
         _LOGGER.debug("[WiiM] %s source_list mapped sources: %s", self.entity_id, mapped_sources)
@@ -444,7 +479,7 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
 
     @property
     def source(self) -> str | None:
-        src = self.coordinator.data.get("status", {}).get("source")
+        src = self._status.get("source")
         return SOURCE_MAP.get(src, src.title()) if src else None
 
     @property
@@ -464,7 +499,14 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return entity specific state attributes."""
-        status = self._effective_status() or {}
+        status = self._effective_status() or _EMPTY
+        # Rebuilt only when the status dict (a fresh one per poll, possibly
+        # the master's) or the HA group membership changed since last read.
+        members = self.coordinator.ha_group_members
+        is_leader = self.coordinator.is_ha_group_leader
+        key = self._attrs_key
+        if key is not None and key[0] is status and key[1] is members and key[2] == is_leader:
+            return self._attrs
         attrs = {
             # Artwork path consumed by frontend via entity_picture
             "entity_picture": status.get("entity_picture") or status.get("cover"),
@@ -487,17 +529,19 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             "eq_presets": status.get("eq_presets", []),
             # Use HA-core constant names so the frontend recognises the
             # grouping capability and displays the chain-link button.
-            HA_ATTR_GROUP_MEMBERS: list(self.coordinator.ha_group_members or []),
-            HA_ATTR_GROUP_LEADER: self.group_leader,
+            HA_ATTR_GROUP_MEMBERS: list(members),
+            HA_ATTR_GROUP_LEADER: self.entity_id if is_leader else None,
             "streaming_service": status.get("streaming_service"),
         }
         _LOGGER.debug("[WiiM] %s extra_state_attributes: %s", self.entity_id, attrs)
+        self._attrs_key = (status, members, is_leader)
+        self._attrs = attrs
         return attrs
 
     @property
     def entity_picture(self) -> str | None:
         """Return URL to current artwork."""
-        status = self._effective_status() or {}
+        status = self._effective_status() or _EMPTY
         pic = status.get("entity_picture") or status.get("cover")
         _LOGGER.debug("[WiiM] %s: entity_picture=%s", self.coordinator.client.host, pic)
         return pic
@@ -508,26 +552,16 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
 
     @property
     def sound_mode(self) -> str | None:
-        preset = self.coordinator.data.get("status", {}).get("eq_preset")
+        preset = self._status.get("eq_preset")
         return EQ_PRESET_MAP.get(preset, "Flat")
 
     async def async_turn_on(self) -> None:
         """Turn the media player on."""
-        try:
-            await self.coordinator.client.set_power(True)
-            await self.coordinator.async_refresh()
-        except WiiMError as err:
-            _LOGGER.error("Failed to turn on WiiM device: %s", err)
-            raise
+        await self._async_command("turn on WiiM device", self.coordinator.client.set_power(True))
 
     async def async_turn_off(self) -> None:
         """Turn the media player off."""
-        try:
-            await self.coordinator.client.set_power(False)
-            await self.coordinator.async_refresh()
-        except WiiMError as err:
-            _LOGGER.error("Failed to turn off WiiM device: %s", err)
-            raise
+        await self._async_command("turn off WiiM device", self.coordinator.client.set_power(False))
 
     def _find_master_coordinator(self):
         _LOGGER.debug("[WiiM] %s: _find_master_coordinator() called", self.entity_id)
@@ -536,7 +570,7 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         if not master_ip:
             # Fallback: search for master by slave_list
             my_ip = self.coordinator.client.host
-            my_uuid = self.coordinator.data.get("status", {}).get("device_id")
+            my_uuid = self._status.get("device_id")
             _LOGGER.debug("[WiiM] %s: Searching for master via slave_list (my_ip=%s, my_uuid=%s)", self.entity_id, my_ip, my_uuid)
             for coord in self.hass.data[DOMAIN].values():
                 if not hasattr(coord, "client") or coord.data is None:
@@ -554,12 +588,10 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             _LOGGER.debug("[WiiM] %s: No master coordinator found via slave_list", self.entity_id)
             return None
         _LOGGER.debug("[WiiM] %s: Master_ip present, searching coordinators", self.entity_id)
-        for coord in self.hass.data[DOMAIN].values():
-            if not hasattr(coord, "client"):
-                continue
-            if coord.client.host == master_ip:
-                _LOGGER.debug("[WiiM] %s: Found master coordinator object for %s", self.entity_id, master_ip)
-                return coord
+        coord = self.hass.data.get(DATA_COORDINATORS_BY_IP, {}).get(master_ip)
+        if coord is not None:
+            _LOGGER.debug("[WiiM] %s: Found master coordinator object for %s", self.entity_id, master_ip)
+            return coord
         _LOGGER.debug("[WiiM] %s: No coordinator object found for master_ip=%s", self.entity_id, master_ip)
         return None
 
@@ -570,11 +602,11 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             master_coord = self._find_master_coordinator()
             if master_coord:
                 await master_coord.client.play()
-                await master_coord.async_refresh()
-                await self.coordinator.async_refresh()
+                await master_coord.async_request_refresh()
+                await self.coordinator.async_request_refresh()
                 return
         await self.coordinator.client.play()
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_request_refresh()
 
     async def async_media_pause(self) -> None:
         """Send pause command."""
@@ -583,20 +615,15 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             master_coord = self._find_master_coordinator()
             if master_coord:
                 await master_coord.client.pause()
-                await master_coord.async_refresh()
-                await self.coordinator.async_refresh()
+                await master_coord.async_request_refresh()
+                await self.coordinator.async_request_refresh()
                 return
         await self.coordinator.client.pause()
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_request_refresh()
 
     async def async_media_stop(self) -> None:
         """Send stop command."""
-        try:
-            await self.coordinator.client.stop()
-            await self.coordinator.async_refresh()
-        except WiiMError as err:
-            _LOGGER.error("Failed to stop WiiM device: %s", err)
-            raise
+        await self._async_command("stop WiiM device", self.coordinator.client.stop())
 
     async def async_media_next_track(self) -> None:
         """Send next track command."""
@@ -605,11 +632,11 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             master_coord = self._find_master_coordinator()
             if master_coord:
                 await master_coord.client.next_track()
-                await master_coord.async_refresh()
-                await self.coordinator.async_refresh()
+                await master_coord.async_request_refresh()
+                await self.coordinator.async_request_refresh()
                 return
         await self.coordinator.client.next_track()
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_request_refresh()
 
     async def async_media_previous_track(self) -> None:
         """Send previous track command."""
@@ -618,38 +645,54 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             master_coord = self._find_master_coordinator()
             if master_coord:
                 await master_coord.client.previous_track()
-                await master_coord.async_refresh()
-                await self.coordinator.async_refresh()
+                await master_coord.async_request_refresh()
+                await self.coordinator.async_request_refresh()
                 return
         await self.coordinator.client.previous_track()
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_request_refresh()
+
+    async def _async_command(self, action: str, command: Awaitable[Any]) -> None:
+        """Await a device *command*, then request a refresh; log and re-raise failures."""
+        try:
+            await command
+        except WiiMError as err:
+            _LOGGER.error("Failed to %s: %s", action, err)
+            raise
+        await self.coordinator.async_request_refresh()
+
+    @callback
+    def _publish_optimistic(self, **changes: Any) -> None:
+        """Publish the status a command is known to produce.
+
+        A new data dict (with a new status dict) is published so identity
+        based caches – including the group entity's member metrics – notice
+        the change, and listeners are notified directly.  Unlike
+        ``async_set_updated_data`` this leaves the poll timer and any pending
+        debounced refresh alone; the next poll reconciles with the device.
+        """
+        coordinator = self.coordinator
+        coordinator.data = {**coordinator.data, "status": {**self._status, **changes}}
+        coordinator.async_update_listeners()
 
     def _volume_step(self) -> float:
-        entry_id = getattr(self.coordinator, 'entry_id', None)
-        if entry_id:
-            entry = self.hass.config_entries.async_get_entry(entry_id)
-            if entry is not None:
-                return entry.options.get(CONF_VOLUME_STEP, DEFAULT_VOLUME_STEP)
-        return 0.05
+        return self.coordinator.volume_step
 
     async def async_volume_up(self) -> None:
         """Volume up the media player."""
-        if volume := self.volume_level:
+        if (volume := self.volume_level) is not None:
             step = self._volume_step()
             try:
-                await self.coordinator.client.set_volume(min(1.0, volume + step))
-                await self.coordinator.async_refresh()
+                await self._async_set_volume_optimistic(min(1.0, volume + step))
             except WiiMError as err:
                 _LOGGER.error("Failed to increase volume on WiiM device: %s", err)
                 raise
 
     async def async_volume_down(self) -> None:
         """Volume down the media player."""
-        if volume := self.volume_level:
+        if (volume := self.volume_level) is not None:
             step = self._volume_step()
             try:
-                await self.coordinator.client.set_volume(max(0.0, volume - step))
-                await self.coordinator.async_refresh()
+                await self._async_set_volume_optimistic(max(0.0, volume - step))
             except WiiMError as err:
                 _LOGGER.error("Failed to decrease volume on WiiM device: %s", err)
                 raise
@@ -657,106 +700,80 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     async def async_set_volume_level(self, volume: float) -> None:
         """Set volume level, range 0..1."""
         try:
-            await self.coordinator.client.set_volume(volume)
-            await self.coordinator.async_refresh()
+            await self._async_set_volume_optimistic(volume)
         except WiiMError as err:
             _LOGGER.error("Failed to set volume on WiiM device: %s", err)
             raise
 
+    async def _async_set_volume_optimistic(self, volume: float) -> None:
+        """Set the volume and publish it without waiting for a poll."""
+        await self.coordinator.client.set_volume(volume)
+        self._publish_optimistic(volume=int(round(volume * 100)), volume_level=volume)
+
     async def async_mute_volume(self, mute: bool) -> None:
         """Mute the volume."""
         try:
             await self.coordinator.client.set_mute(mute)
-            await self.coordinator.async_refresh()
+            self._publish_optimistic(mute=mute)
         except WiiMError as err:
             _LOGGER.error("Failed to mute WiiM device: %s", err)
             raise
 
     async def async_select_source(self, source: str) -> None:
         src_api = next((k for k, v in SOURCE_MAP.items() if v == source), source.lower())
-        await self.coordinator.client.set_source(src_api)
-        await self.coordinator.async_refresh()
+        await self._async_command("select source on WiiM device", self.coordinator.client.set_source(src_api))
 
     async def async_clear_playlist(self) -> None:
         """Clear players playlist."""
-        try:
-            await self.coordinator.client.clear_playlist()
-            await self.coordinator.async_refresh()
-        except WiiMError as err:
-            _LOGGER.error("Failed to clear playlist on WiiM device: %s", err)
-            raise
+        await self._async_command("clear playlist on WiiM device", self.coordinator.client.clear_playlist())
 
     async def async_set_shuffle(self, shuffle: bool) -> None:
         """Enable/disable shuffle mode."""
+        repeat_all = self._play_mode_flags()[1] == "all"
+        if shuffle:
+            mode = PLAY_MODE_SHUFFLE_REPEAT_ALL if repeat_all else PLAY_MODE_SHUFFLE
+        else:
+            mode = PLAY_MODE_REPEAT_ALL if repeat_all else PLAY_MODE_NORMAL
         try:
-            if shuffle:
-                if self.repeat == "all":
-                    await self.coordinator.client.set_shuffle_mode(
-                        PLAY_MODE_SHUFFLE_REPEAT_ALL
-                    )
-                else:
-                    await self.coordinator.client.set_shuffle_mode(PLAY_MODE_SHUFFLE)
-            else:
-                if self.repeat == "all":
-                    await self.coordinator.client.set_shuffle_mode(PLAY_MODE_REPEAT_ALL)
-                else:
-                    await self.coordinator.client.set_shuffle_mode(PLAY_MODE_NORMAL)
-            await self.coordinator.async_refresh()
+            await self.coordinator.client.set_shuffle_mode(mode)
+            self._publish_optimistic(play_mode=mode)
         except WiiMError as err:
             _LOGGER.error("Failed to set shuffle mode on WiiM device: %s", err)
             raise
 
     async def async_set_repeat(self, repeat: str) -> None:
         """Set repeat mode."""
+        shuffle = self._play_mode_flags()[0]
+        if repeat == "all":
+            mode = PLAY_MODE_SHUFFLE_REPEAT_ALL if shuffle else PLAY_MODE_REPEAT_ALL
+        elif repeat == "one":
+            mode = PLAY_MODE_REPEAT_ONE
+        else:
+            mode = PLAY_MODE_SHUFFLE if shuffle else PLAY_MODE_NORMAL
         try:
-            if repeat == "all":
-                if self.shuffle:
-                    await self.coordinator.client.set_repeat_mode(
-                        PLAY_MODE_SHUFFLE_REPEAT_ALL
-                    )
-                else:
-                    await self.coordinator.client.set_repeat_mode(PLAY_MODE_REPEAT_ALL)
-            elif repeat == "one":
-                await self.coordinator.client.set_repeat_mode(PLAY_MODE_REPEAT_ONE)
-            elif self.shuffle:
-                await self.coordinator.client.set_repeat_mode(PLAY_MODE_SHUFFLE)
-            else:
-                await self.coordinator.client.set_repeat_mode(PLAY_MODE_NORMAL)
-            await self.coordinator.async_refresh()
+            await self.coordinator.client.set_repeat_mode(mode)
+            self._publish_optimistic(play_mode=mode)
         except WiiMError as err:
             _LOGGER.error("Failed to set repeat mode on WiiM device: %s", err)
             raise
 
     async def async_play_preset(self, preset: int) -> None:
         """Handle the play_preset service call."""
-        try:
-            await self.coordinator.client.play_preset(preset)
-            await self.coordinator.async_refresh()
-        except WiiMError as err:
-            _LOGGER.error("Failed to play preset on WiiM device: %s", err)
-            raise
+        await self._async_command("play preset on WiiM device", self.coordinator.client.play_preset(preset))
 
     async def async_toggle_power(self) -> None:
         """Handle the toggle_power service call."""
-        try:
-            await self.coordinator.client.toggle_power()
-            await self.coordinator.async_refresh()
-        except WiiMError as err:
-            _LOGGER.error("Failed to toggle power on WiiM device: %s", err)
-            raise
+        await self._async_command("toggle power on WiiM device", self.coordinator.client.toggle_power())
 
     def _entity_id_to_host(self, entity_id: str) -> str:
         """Map HA entity_id to device IP address (host)."""
         _LOGGER.debug("[WiiM] %s: _entity_id_to_host() called with entity_id=%s", self.entity_id, entity_id)
 
-        # First try: Direct IP-based mapping (legacy scheme)
-        for coord in self.hass.data[DOMAIN].values():
-            if not hasattr(coord, "client"):
-                continue
-            expected = f"media_player.wiim_{coord.client.host.replace('.', '_')}"
-            if expected == entity_id:
-                _LOGGER.debug("[WiiM] _entity_id_to_host: Direct match found for host=%s", coord.client.host)
-                return coord.client.host
+        # First try: entity_id index
+        coord = _coordinator_by_entity_id(self.hass, entity_id)
+        if coord is not None:
+            _LOGGER.debug("[WiiM] _entity_id_to_host: Direct match found for host=%s", coord.client.host)
+            return coord.client.host
 
         # Second try: Entity registry lookup
         try:
@@ -769,10 +786,9 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
                 _LOGGER.debug("[WiiM] _entity_id_to_host: Registry lookup found unique_id=%s", unique)
 
                 # Try to match by unique_id (which should be the host IP)
-                for coord in self.hass.data[DOMAIN].values():
-                    if hasattr(coord, "client") and coord.client.host == unique:
-                        _LOGGER.debug("[WiiM] _entity_id_to_host: Match found via unique_id for host=%s", coord.client.host)
-                        return coord.client.host
+                if unique in self.hass.data.get(DATA_COORDINATORS_BY_IP, {}):
+                    _LOGGER.debug("[WiiM] _entity_id_to_host: Match found via unique_id for host=%s", unique)
+                    return unique
 
                 # Try to match by device name
                 device_name = ent_entry.name or ent_entry.original_name
@@ -781,7 +797,7 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
                         if not hasattr(coord, "client"):
                             continue
                         status = coord.data.get("status", {})
-                        device_name_from_status = status.get("DeviceName") or status.get("device_name")
+                        device_name_from_status = status.get("device_name")
                         if device_name_from_status and device_name_from_status.lower() == device_name.lower():
                             _LOGGER.debug("[WiiM] _entity_id_to_host: Match found via device name for host=%s", coord.client.host)
                             return coord.client.host
@@ -848,16 +864,13 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             #    desired `group_members` list (automatic pruning)
             # ------------------------------------------------------------------
             desired_hosts = {self._entity_id_to_host(eid) for eid in group_members if eid != self.entity_id and _find_coordinator(self.hass, eid) is not None}
-            current_slaves = set(self.coordinator.wiim_group_members)
+            current_slaves = self.coordinator.wiim_group_members
             _LOGGER.debug("[WiiM] %s: desired_hosts=%s, current_slaves=%s", self.entity_id, desired_hosts, current_slaves)
 
             extraneous_slaves = current_slaves - desired_hosts
             for slave_ip in extraneous_slaves:
                 _LOGGER.info("[WiiM] %s: Removing extraneous slave %s from group", self.entity_id, slave_ip)
-                slave_coord = next(
-                    (c for c in self.hass.data[DOMAIN].values() if hasattr(c, "client") and c.client.host == slave_ip),
-                    None,
-                )
+                slave_coord = self.hass.data.get(DATA_COORDINATORS_BY_IP, {}).get(slave_ip)
                 if slave_coord is not None:
                     try:
                         await slave_coord.leave_wiim_group()
@@ -925,7 +938,7 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         if media_type == "preset" and media_id.startswith("preset_"):
             preset_num = int(media_id.split("_")[1])
             await self.coordinator.client.play_preset(preset_num)
-            await self.coordinator.async_refresh()
+            await self.coordinator.async_request_refresh()
         else:
             if media_type == "url":
                 await self.coordinator.client.play_url(media_id)
@@ -936,13 +949,11 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
 
     async def async_play_url(self, url: str) -> None:
         """Play a URL."""
-        await self.coordinator.client.play_url(url)
-        await self.coordinator.async_refresh()
+        await self._async_command("play URL on WiiM device", self.coordinator.client.play_url(url))
 
     async def async_play_playlist(self, playlist_url: str) -> None:
         """Play an M3U playlist."""
-        await self.coordinator.client.play_playlist(playlist_url)
-        await self.coordinator.async_refresh()
+        await self._async_command("play playlist on WiiM device", self.coordinator.client.play_playlist(playlist_url))
 
     async def async_set_eq(self, preset: str, custom_values: list[int] | None = None) -> None:
         """Set EQ preset or custom values."""
@@ -958,12 +969,11 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
             await self.coordinator.client.set_eq_custom(custom_values)
         else:
             await self.coordinator.client.set_eq_preset(preset)
-        await self.coordinator.async_refresh()
+        await self.coordinator.async_request_refresh()
 
     async def async_set_eq_enabled(self, enabled: bool) -> None:
         """Enable or disable EQ."""
-        await self.coordinator.client.set_eq_enabled(enabled)
-        await self.coordinator.async_refresh()
+        await self._async_command("set EQ on WiiM device", self.coordinator.client.set_eq_enabled(enabled))
 
     async def async_select_sound_mode(self, sound_mode: str) -> None:
         """Select sound mode (EQ preset)."""
@@ -975,7 +985,7 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         preset = next((k for k, v in EQ_PRESET_MAP.items() if v == sound_mode), None)
         if preset:
             await self.coordinator.client.set_eq_preset(preset)
-            await self.coordinator.async_refresh()
+            await self.coordinator.async_request_refresh()
 
     async def async_browse_media(self, media_content_type=None, media_content_id=None):
         presets = [
@@ -1001,8 +1011,7 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
         )
 
     async def async_play_notification(self, url: str) -> None:
-        await self.coordinator.client.play_notification(url)
-        await self.coordinator.async_refresh()
+        await self._async_command("play notification on WiiM device", self.coordinator.client.play_notification(url))
 
     # ------------------------------------------------------------------
     # Media-image helper properties – these let Home Assistant *proxy* the
@@ -1073,22 +1082,28 @@ class WiiMMediaPlayer(CoordinatorEntity, MediaPlayerEntity):
     @property
     def app_name(self) -> str | None:  # noqa: D401 – HA property name
         """Return the name of the current streaming service (Spotify, Tidal…)."""
-        service = self.coordinator.data.get("status", {}).get("streaming_service")
+        service = self._status.get("streaming_service")
         return service
 
 
+def _coordinator_by_entity_id(hass: HomeAssistant, entity_id: str) -> WiiMCoordinator | None:
+    """Return the coordinator behind a WiiM media player *entity_id*, if known.
+
+    Entities register themselves in the index once added to HA and drop out
+    on removal; anything else is left to the entity-registry lookups.
+    """
+    return hass.data.get(DATA_COORDINATORS_BY_ENTITY_ID, {}).get(entity_id)
+
+
 def _find_coordinator(hass: HomeAssistant, entity_id: str) -> WiiMCoordinator | None:
     """Return coordinator for the given entity ID."""
     _LOGGER.debug("[WiiM] _find_coordinator: Looking up coordinator for entity_id=%s", entity_id)
 
-    # First try: Direct entity ID to host mapping
-    for coord in hass.data[DOMAIN].values():
-        if not hasattr(coord, "client"):
-            continue
-        expected = f"media_player.wiim_{coord.client.host.replace('.', '_')}"
-        if expected == entity_id:
-            _LOGGER.debug("[WiiM] _find_coordinator: Direct match found for host=%s", coord.client.host)
-            return coord
+    # First try: entity_id index
+    coord = _coordinator_by_entity_id(hass, entity_id)
+    if coord is not None:
+        _LOGGER.debug("[WiiM] _find_coordinator: Direct match found for host=%s", coord.client.host)
+        return coord
 
     # Second try: Entity registry lookup
     try:
@@ -1101,10 +1116,10 @@ def _find_coordinator(hass: HomeAssistant, entity_id: str) -> WiiMCoordinator |
             _LOGGER.debug("[WiiM] _find_coordinator: Registry lookup found unique_id=%s", unique)
 
             # Try to match by unique_id (which should be the host IP)
-            for coord in hass.data[DOMAIN].values():
-                if hasattr(coord, "client") and coord.client.host == unique:
-                    _LOGGER.debug("[WiiM] _find_coordinator: Match found via unique_id for host=%s", coord.client.host)
-                    return coord
+            coord = hass.data.get(DATA_COORDINATORS_BY_IP, {}).get(unique)
+            if coord is not None:
+                _LOGGER.debug("[WiiM] _find_coordinator: Match found via unique_id for host=%s", unique)
+                return coord
 
             # Try to match by device name
             device_name = ent_entry.name or ent_entry.original_name
@@ -1113,7 +1128,7 @@ def _find_coordinator(hass: HomeAssistant, entity_id: str) -> WiiMCoordinator |
                     if not hasattr(coord, "client"):
                         continue
                     status = coord.data.get("status", {})
-                    device_name_from_status = status.get("DeviceName") or status.get("device_name")
+                    device_name_from_status = status.get("device_name")
                     if device_name_from_status and device_name_from_status.lower() == device_name.lower():
                         _LOGGER.debug("[WiiM] _find_coordinator: Match found via device name for host=%s", coord.client.host)
                         return coord
@@ -5,8 +5,8 @@ from __future__ import annotations
 from homeassistant.components.number import NumberEntity
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from datetime import timedelta
 
@@ -24,7 +24,7 @@ async def async_setup_entry(
     entry: ConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
-    coordinator: WiiMCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: WiiMCoordinator = entry.runtime_data
     entities: list[NumberEntity] = [
         _PollIntervalNumber(coordinator, entry),
         _VolumeStepNumber(coordinator, entry),
@@ -40,15 +40,11 @@ class _BaseWiiMNumber(CoordinatorEntity[WiiMCoordinator], NumberEntity):
         self._key = key
         self._attr_unique_id = f"{coordinator.client.host}-{key}"
         self._attr_name = name
-        status = coordinator.data.get("status", {}) if isinstance(coordinator.data, dict) else {}
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.client.host)},
-            name=coordinator.friendly_name,
-            manufacturer="WiiM",
-            model=status.get("hardware") or status.get("project"),
-            sw_version=status.get("firmware"),
-            connections={("mac", status.get("MAC"))} if status.get("MAC") else set(),
-        )
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the speaker's current device-registry identity."""
+        return self.coordinator.device_info
 
     def _save(self, value):
         # Update config_entry.options atomically
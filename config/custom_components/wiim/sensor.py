@@ -40,7 +40,7 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up diagnostic sensors for a config entry."""
-    coordinator: WiiMCoordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: WiiMCoordinator = entry.runtime_data
     entities: list[SensorEntity] = []
 
     for key in SENSORS:
@@ -62,15 +62,11 @@ class _WiiMDiagnosticSensor(CoordinatorEntity[WiiMCoordinator], SensorEntity):
         self._attr_name = meta["name"]
         self._attr_native_unit_of_measurement = meta["unit"]
         self._attr_device_class = meta["device_class"]
-        status = coordinator.data.get("status", {}) if isinstance(coordinator.data, dict) else {}
-        self._attr_device_info = DeviceInfo(
-            identifiers={(DOMAIN, coordinator.client.host)},
-            name=coordinator.friendly_name,
-            manufacturer="WiiM",
-            model=status.get("hardware") or status.get("project"),
-            sw_version=status.get("firmware"),
-            connections={("mac", status.get("MAC"))} if status.get("MAC") else set(),
-        )
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return the speaker's current device-registry identity."""
+        return self.coordinator.device_info
 
     @property
     def native_value(self) -> Any | None:  # type: ignore[override]
@@ -68,10 +68,9 @@ async def setup_integration(hass: HomeAssistant, mock_client, enable_custom_inte
     )
     entry.add_to_hass(hass)
 
-    with (
-        patch("custom_components.wiim.api.WiiMClient", return_value=mock_client),
-        patch("custom_components.wiim.__init__.WiiMClient", return_value=mock_client),
-    ):
+    # WiiMClient is imported lazily inside async_setup_entry, so patching the
+    # api module is sufficient.
+    with patch("custom_components.wiim.api.WiiMClient", return_value=mock_client):
         assert await hass.config_entries.async_setup(entry.entry_id)
         await hass.async_block_till_done()
 
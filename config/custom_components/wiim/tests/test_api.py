@@ -1,11 +1,19 @@
 """Tests for the WiiM API client."""
 from __future__ import annotations
 
+import asyncio
+
 import pytest
 import aiohttp
-from unittest.mock import patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
-from custom_components.wiim.api import WiiMClient, WiiMError
+from custom_components.wiim.api import (
+    WiiMClient,
+    WiiMConnectionError,
+    WiiMError,
+    WiiMRequestError,
+    _hex_to_str,
+)
 
 MOCK_HOST = "192.168.1.100"
 MOCK_PORT = 80
@@ -13,20 +21,26 @@ MOCK_DEVICE_NAME = "Test Device"
 MOCK_DEVICE_ID = "test-device-id"
 MOCK_MAC = "00:11:22:33:44:55"
 
+# conftest stubs out WiiMClient._request for every test; keep the real one
+_REAL_REQUEST = WiiMClient._request
+
 # ------------------------------------------------------------------
 # Fixtures
 # ------------------------------------------------------------------
 
 class _DummyResp:
-    def __init__(self, text_data="{}"):
-        self._text = text_data
+    status = 200
+
+    def __init__(self, body=b"{}"):
+        self._body = body
 
-    async def text(self):
-        return self._text
+    async def read(self):
+        return self._body
 
     def raise_for_status(self):
         return None
 
+
 class _DummyCtxMgr:
     def __init__(self, resp):
         self._resp = resp
@@ -37,6 +51,7 @@ class _DummyCtxMgr:
     async def __aexit__(self, *_exc):
         return False
 
+
 class _DummySession:
     def __init__(self, *args, **kwargs):
         pass
@@ -47,17 +62,20 @@ class _DummySession:
     async def close(self):
         pass
 
+
 @pytest.fixture(autouse=True)
 def patch_aiohttp_session(monkeypatch):
     """Patch aiohttp.ClientSession globally for all API tests."""
     monkeypatch.setattr(aiohttp, "ClientSession", _DummySession)
     yield
 
+
 @pytest.fixture
 def api_client():
     """Create a WiiM API client."""
     return WiiMClient(MOCK_HOST, MOCK_PORT)
 
+
 @pytest.mark.asyncio
 async def test_client_initialization(api_client):
     """Test client initialization."""
@@ -67,6 +85,7 @@ async def test_client_initialization(api_client):
         f"http://{MOCK_HOST}:{MOCK_PORT}" if MOCK_PORT == 80 else f"https://{MOCK_HOST}:{MOCK_PORT}"
     )
 
+
 @pytest.mark.asyncio
 async def test_get_status_success(api_client):
     """Test successful status retrieval."""
@@ -77,6 +96,7 @@ async def test_get_status_success(api_client):
     assert result["play_status"] == "play"
     assert result["volume"] == 50
 
+
 @pytest.mark.asyncio
 async def test_get_status_failure(api_client):
     """Test failed status retrieval."""
@@ -84,6 +104,7 @@ async def test_get_status_failure(api_client):
         with pytest.raises(WiiMError):
             await api_client.get_status()
 
+
 @pytest.mark.asyncio
 async def test_play_control(api_client):
     """Test play control commands."""
@@ -98,6 +119,7 @@ async def test_play_control(api_client):
     finally:
         patcher.stop()
 
+
 @pytest.mark.asyncio
 async def test_volume_control(api_client):
     """Test volume control commands."""
@@ -110,6 +132,7 @@ async def test_volume_control(api_client):
     finally:
         patcher.stop()
 
+
 @pytest.mark.asyncio
 async def test_group_management(api_client):
     """Test group management commands."""
@@ -123,6 +146,7 @@ async def test_group_management(api_client):
     finally:
         patcher.stop()
 
+
 @pytest.mark.asyncio
 async def test_error_handling(api_client):
     """Test error handling."""
@@ -130,9 +154,76 @@ async def test_error_handling(api_client):
         with pytest.raises(WiiMError):
             await api_client.get_status()
 
+
 @pytest.mark.asyncio
 async def test_session_management(api_client):
     """Test session management."""
     with patch.object(WiiMClient, "_request", return_value={}):
         await api_client.get_status()
-    await api_client.close()
\ No newline at end of file
+    await api_client.close()
+
+
+@pytest.mark.asyncio
+async def test_parse_player_status_numeric_fields(api_client):
+    """Numeric fields are converted and malformed values are tolerated."""
+    parsed = api_client._parse_player_status(
+        {"vol": "35", "mute": "1", "curpos": "61000", "totlen": "bad", "loop": "x"}
+    )
+    assert parsed["volume"] == 35
+    assert parsed["volume_level"] == 0.35
+    assert parsed["mute"] is True
+    assert parsed["position"] == 61
+    assert "duration" not in parsed
+    assert parsed["play_mode"] == "normal"
+
+    parsed = api_client._parse_player_status({"vol": "loud"})
+    assert "volume_level" not in parsed
+
+
+@pytest.mark.asyncio
+async def test_parse_player_status_zero_position(api_client):
+    """A position/duration of 0 (track start, live streams) is kept."""
+    parsed = api_client._parse_player_status({"curpos": "0", "totlen": "0"})
+    assert parsed["position"] == 0
+    assert parsed["duration"] == 0
+
+
+def test_hex_to_str_tolerates_whitespace():
+    """Hex metadata with surrounding or embedded whitespace still decodes."""
+    assert _hex_to_str("48656c6c6f") == "Hello"
+    assert _hex_to_str(" 48656c6c6f\n") == "Hello"
+    assert _hex_to_str("48 65 6c 6c 6f") == "Hello"
+    assert _hex_to_str("abc") == "abc"  # odd length – already plain text
+
+
+@pytest.mark.asyncio
+async def test_probe_port_prefers_configured_port(monkeypatch):
+    """A device answering on both ports keeps the configured HTTPS port."""
+    async def _open_connection(_host, port):
+        # Port 80 answers first; the configured port a little later
+        await asyncio.sleep(0 if port == 80 else 0.01)
+        return MagicMock(), MagicMock(wait_closed=AsyncMock())
+
+    monkeypatch.setattr(asyncio, "open_connection", _open_connection)
+    client = WiiMClient(MOCK_HOST, 443)
+    assert await client._probe_port() == 443
+
+
+@pytest.mark.asyncio
+async def test_learned_port_survives_http_errors(api_client):
+    """HTTP status errors keep the learned port; connection errors reset it."""
+    api_client._working_port = 80
+    resp = _DummyResp()
+    resp.raise_for_status = MagicMock(
+        side_effect=aiohttp.ClientResponseError(MagicMock(), (), status=404)
+    )
+    api_client._session = MagicMock()
+    api_client._session.request.return_value = _DummyCtxMgr(resp)
+    with pytest.raises(WiiMRequestError):
+        await _REAL_REQUEST(api_client, "/httpapi.asp?command=unknown")
+    assert api_client._working_port == 80
+
+    api_client._session.request.side_effect = aiohttp.ServerDisconnectedError()
+    with pytest.raises(WiiMConnectionError):
+        await _REAL_REQUEST(api_client, "/httpapi.asp?command=getStatusEx")
+    assert api_client._working_port is None
@@ -10,6 +10,7 @@ from custom_components.wiim.api import WiiMError
 
 MOCK_HOST = "192.168.1.100"
 
+
 @pytest.mark.asyncio
 async def test_coordinator_update_success(hass: HomeAssistant, mock_coordinator, mock_client):
     """Test successful coordinator update."""
@@ -25,6 +26,7 @@ async def test_coordinator_update_success(hass: HomeAssistant, mock_coordinator,
     assert "role" in mock_coordinator.data
     assert mock_coordinator.data["role"] == "solo"
 
+
 @pytest.mark.asyncio
 async def test_coordinator_update_failure(hass: HomeAssistant, mock_coordinator, mock_client):
     """Test coordinator update failure."""
@@ -35,6 +37,7 @@ async def test_coordinator_update_failure(hass: HomeAssistant, mock_coordinator,
     await mock_coordinator.async_refresh()
     assert mock_coordinator.last_update_success is False
 
+
 @pytest.mark.asyncio
 async def test_coordinator_group_management(hass: HomeAssistant, mock_coordinator, mock_client):
     """Test group management functions."""
@@ -51,12 +54,14 @@ async def test_coordinator_group_management(hass: HomeAssistant, mock_coordinato
     await mock_coordinator.leave_wiim_group()
     await mock_coordinator.delete_wiim_group()
 
+
 @pytest.mark.asyncio
 async def test_coordinator_group_registry(hass: HomeAssistant, mock_coordinator):
     """Test group registry functionality."""
     # Should return None for unknown master
     assert mock_coordinator.get_group_by_master("unknown") is None
 
+
 @pytest.mark.asyncio
 async def test_coordinator_poll_interval_management(hass: HomeAssistant, mock_coordinator):
     """Test poll interval management."""
@@ -67,6 +72,7 @@ async def test_coordinator_poll_interval_management(hass: HomeAssistant, mock_co
     await mock_coordinator.async_start()
     await mock_coordinator.async_stop()
 
+
 @pytest.mark.asyncio
 async def test_coordinator_error_handling(hass: HomeAssistant, mock_coordinator, mock_client):
     """Test error handling in coordinator."""
@@ -77,10 +83,144 @@ async def test_coordinator_error_handling(hass: HomeAssistant, mock_coordinator,
     await mock_coordinator.async_refresh()
     assert mock_coordinator.last_update_success is False
 
+
 @pytest.mark.asyncio
 async def test_coordinator_multiroom_state(hass: HomeAssistant, mock_coordinator, mock_client):
     """Test multiroom state properties."""
     mock_client.is_master = False
     assert not mock_coordinator.is_wiim_master
     mock_client.is_master = True
-    assert mock_coordinator.is_wiim_master
\ No newline at end of file
+    assert mock_coordinator.is_wiim_master
+
+
+@pytest.mark.asyncio
+async def test_coordinator_uses_multiroom_from_status(hass: HomeAssistant, mock_coordinator, mock_client):
+    """Once getStatusEx is seen to embed multiroom info, getSlaveList is skipped."""
+    status = {"device_name": "Test Device", "power": True, "multiroom": {"slaves": 0, "slave_list": []}}
+    mock_client.get_player_status = AsyncMock(return_value={"play_status": "stop", "power": True})
+    mock_client.get_status = AsyncMock(return_value=status)
+    mock_client.get_multiroom_info = AsyncMock(return_value={"slave_list": [], "type": "0"})
+    mock_client.get_meta_info = AsyncMock(return_value={})
+
+    await mock_coordinator.async_refresh()
+    await mock_coordinator.async_refresh()
+
+    assert mock_coordinator.last_update_success
+    assert mock_client.get_multiroom_info.await_count == 1
+    assert mock_coordinator.data["multiroom"] == status["multiroom"]
+
+
+@pytest.mark.asyncio
+async def test_coordinator_meta_info_cached_on_failure(hass: HomeAssistant, mock_coordinator, mock_client):
+    """Meta info is fetched on track changes only and never applied to a different track."""
+    mock_client.get_player_status = AsyncMock(return_value={"play_status": "play", "power": True, "title": "raw"})
+    mock_client.get_status = AsyncMock(return_value={"device_name": "Test Device"})
+    mock_client.get_multiroom_info = AsyncMock(return_value={"slave_list": [], "type": "0"})
+    mock_client.get_meta_info = AsyncMock(return_value={"title": "Song", "artist": "Band", "album": "LP", "albumArtURI": "http://art"})
+
+    await mock_coordinator.async_refresh()
+    assert mock_coordinator.data["status"]["title"] == "Song"
+
+    # Same track – meta info is not fetched again
+    await mock_coordinator.async_refresh()
+    assert mock_client.get_meta_info.await_count == 1
+    assert mock_coordinator.data["status"]["title"] == "Song"
+
+    # Track changed but the fetch fails – the previous track's meta must not leak
+    mock_client.get_player_status = AsyncMock(return_value={"play_status": "play", "power": True, "title": "next"})
+    mock_client.get_meta_info = AsyncMock(side_effect=WiiMError("fail"))
+    await mock_coordinator.async_refresh()
+    assert mock_coordinator.last_update_success
+    assert mock_client.get_meta_info.await_count == 1
+    assert mock_coordinator.data["status"]["title"] == "next"
+    assert "entity_picture" not in mock_coordinator.data["status"]
+
+
+@pytest.mark.asyncio
+async def test_coordinator_adaptive_poll_interval(hass: HomeAssistant, mock_coordinator, mock_client):
+    """The poll interval follows the playback state."""
+    mock_client.get_status = AsyncMock(return_value={"device_name": "Test Device"})
+    mock_client.get_multiroom_info = AsyncMock(return_value={"slave_list": [], "type": "0"})
+    mock_client.get_meta_info = AsyncMock(return_value={})
+    base = mock_coordinator._base_poll_interval
+
+    mock_client.get_player_status = AsyncMock(return_value={"play_status": "play", "power": True})
+    await mock_coordinator.async_refresh()
+    assert mock_coordinator.update_interval.total_seconds() == base
+
+    mock_client.get_player_status = AsyncMock(return_value={"play_status": "pause", "power": True})
+    await mock_coordinator.async_refresh()
+    assert mock_coordinator.update_interval.total_seconds() == base * 3
+
+
+@pytest.mark.asyncio
+async def test_coordinator_degrades_without_multiroom(hass: HomeAssistant, mock_coordinator, mock_client):
+    """A failed multiroom call degrades to solo; multiroom alone is not enough."""
+    mock_client.get_player_status = AsyncMock(return_value={"play_status": "play", "power": True})
+    mock_client.get_status = AsyncMock(return_value={"device_name": "Test Device"})
+    mock_client.get_multiroom_info = AsyncMock(side_effect=WiiMError("fail"))
+    await mock_coordinator.async_refresh()
+    assert mock_coordinator.last_update_success
+    assert mock_coordinator.data["role"] == "solo"
+
+    mock_client.get_player_status = AsyncMock(side_effect=WiiMError("fail"))
+    mock_client.get_status = AsyncMock(side_effect=WiiMError("fail"))
+    mock_client.get_multiroom_info = AsyncMock(return_value={"slave_list": [], "type": "0"})
+    await mock_coordinator.async_refresh()
+    assert mock_coordinator.last_update_success is False
+
+
+@pytest.mark.asyncio
+async def test_coordinator_tracks_ha_group_changes(hass: HomeAssistant, mock_coordinator):
+    """HA group membership follows state changes of the speaker's entity."""
+    entity_id = mock_coordinator._ha_entity_id
+    unsub = mock_coordinator.async_track_ha_group()
+    assert mock_coordinator.ha_group_members == frozenset()
+
+    hass.states.async_set(entity_id, "playing", {"group_members": [entity_id, "media_player.other"], "group_leader": entity_id})
+    await hass.async_block_till_done()
+    assert mock_coordinator.ha_group_members == {entity_id, "media_player.other"}
+    assert mock_coordinator.is_ha_group_leader
+
+    unsub()
+    hass.states.async_set(entity_id, "idle", {})
+    await hass.async_block_till_done()
+    assert mock_coordinator.is_ha_group_leader
+
+
+@pytest.mark.asyncio
+async def test_coordinator_set_base_poll_interval(hass: HomeAssistant, mock_coordinator):
+    """A new base interval keeps the back-off factor of the current play state."""
+    mock_coordinator.data = {"status": {"play_status": "pause"}}
+    mock_coordinator.set_base_poll_interval(2)
+    assert mock_coordinator.update_interval.total_seconds() == 6
+
+
+@pytest.mark.asyncio
+async def test_coordinator_backoff_respects_state_interval(hass: HomeAssistant, mock_coordinator, mock_client):
+    """Back-off never polls a paused or idle device faster than when healthy."""
+    mock_client.get_player_status = AsyncMock(side_effect=WiiMError("fail"))
+    mock_client.get_status = AsyncMock(side_effect=WiiMError("fail"))
+    mock_client.get_multiroom_info = AsyncMock(side_effect=WiiMError("fail"))
+    base = mock_coordinator._base_poll_interval
+
+    for play_state, factor in (("pause", 3), ("stop", 6)):
+        mock_coordinator.data = {"status": {"play_status": play_state}}
+        mock_coordinator._consecutive_failures = 0
+        for _ in range(3):
+            await mock_coordinator.async_refresh()
+        assert mock_coordinator.update_interval.total_seconds() >= base * factor
+
+
+@pytest.mark.asyncio
+async def test_coordinator_device_info_follows_status(hass: HomeAssistant, mock_coordinator):
+    """device_info is reused while unchanged and rebuilt on rename/firmware update."""
+    mock_coordinator.data = {"status": {"device_name": "Kitchen", "firmware": "1.0"}}
+    info = mock_coordinator.device_info
+    assert mock_coordinator.device_info is info
+
+    mock_coordinator.data = {"status": {"device_name": "Patio", "firmware": "1.1", "MAC": "aa:bb"}}
+    info = mock_coordinator.device_info
+    assert info["name"] == "Patio"
+    assert info["sw_version"] == "1.1"
+    assert info["connections"] == {("mac", "aa:bb")}
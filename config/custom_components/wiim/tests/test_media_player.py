@@ -2,14 +2,21 @@
 from __future__ import annotations
 
 import pytest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 from homeassistant.components.media_player import (
     MediaPlayerEntityFeature,
 )
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 
-from custom_components.wiim.media_player import WiiMMediaPlayer
+from custom_components.wiim.api import WiiMError
+from custom_components.wiim.const import (
+    DATA_COORDINATORS_BY_ENTITY_ID,
+    DATA_COORDINATORS_BY_IP,
+)
+from custom_components.wiim.group_media_player import WiiMGroupMediaPlayer
+from custom_components.wiim.media_player import WiiMMediaPlayer, _find_coordinator
 
 # ------------------------------------------------------------------
 # Helper
@@ -36,9 +43,12 @@ def _make_entity(hass: HomeAssistant, mock_client):
         "role": "solo",
         "ha_group": {"is_leader": False, "members": []},
     }
+    # Commands request a debounced refresh; keep its timer out of the tests
+    coordinator.async_request_refresh = AsyncMock()
     entity = WiiMMediaPlayer(coordinator)
     return entity
 
+
 @pytest.mark.asyncio
 async def test_media_player_setup(setup_integration, mock_client, hass: HomeAssistant):
     """Test media player setup."""
@@ -49,24 +59,25 @@ async def test_media_player_setup(setup_integration, mock_client, hass: HomeAssi
     assert entity.media_artist == "Test Artist"
     assert entity.media_album_name == "Test Album"
 
+
 @pytest.mark.asyncio
 async def test_media_player_turn_on(setup_integration, mock_client, hass: HomeAssistant):
     """Test turning on the media player."""
     entity = _make_entity(hass, mock_client)
     mock_client.set_power = AsyncMock()
-    entity.coordinator.async_refresh = AsyncMock()
     await entity.async_turn_on()
     mock_client.set_power.assert_called_with(True)
 
+
 @pytest.mark.asyncio
 async def test_media_player_turn_off(setup_integration, mock_client, hass: HomeAssistant):
     """Test turning off the media player."""
     entity = _make_entity(hass, mock_client)
     mock_client.set_power = AsyncMock()
-    entity.coordinator.async_refresh = AsyncMock()
     await entity.async_turn_off()
     mock_client.set_power.assert_called_with(False)
 
+
 @pytest.mark.asyncio
 async def test_media_player_play(setup_integration, mock_client, hass: HomeAssistant):
     """Test playing media."""
@@ -74,6 +85,8 @@ async def test_media_player_play(setup_integration, mock_client, hass: HomeAssis
     mock_client.play = AsyncMock()
     await entity.async_media_play()
     mock_client.play.assert_called_once()
+    entity.coordinator.async_request_refresh.assert_awaited_once()
+
 
 @pytest.mark.asyncio
 async def test_media_player_pause(setup_integration, mock_client, hass: HomeAssistant):
@@ -83,15 +96,16 @@ async def test_media_player_pause(setup_integration, mock_client, hass: HomeAssi
     await entity.async_media_pause()
     mock_client.pause.assert_called_once()
 
+
 @pytest.mark.asyncio
 async def test_media_player_stop(setup_integration, mock_client, hass: HomeAssistant):
     """Test stopping media."""
     entity = _make_entity(hass, mock_client)
     mock_client.stop = AsyncMock()
-    entity.coordinator.async_refresh = AsyncMock()
     await entity.async_media_stop()
     mock_client.stop.assert_called_once()
 
+
 @pytest.mark.asyncio
 async def test_media_player_next_track(setup_integration, mock_client, hass: HomeAssistant):
     """Test next track."""
@@ -100,6 +114,7 @@ async def test_media_player_next_track(setup_integration, mock_client, hass: Hom
     await entity.async_media_next_track()
     mock_client.next_track.assert_called_once()
 
+
 @pytest.mark.asyncio
 async def test_media_player_previous_track(setup_integration, mock_client, hass: HomeAssistant):
     """Test previous track."""
@@ -108,6 +123,7 @@ async def test_media_player_previous_track(setup_integration, mock_client, hass:
     await entity.async_media_previous_track()
     mock_client.previous_track.assert_called_once()
 
+
 @pytest.mark.asyncio
 async def test_media_player_volume_up(setup_integration, mock_client, hass: HomeAssistant):
     """Test volume up."""
@@ -116,6 +132,7 @@ async def test_media_player_volume_up(setup_integration, mock_client, hass: Home
     await entity.async_volume_up()
     mock_client.set_volume.assert_called()
 
+
 @pytest.mark.asyncio
 async def test_media_player_volume_down(setup_integration, mock_client, hass: HomeAssistant):
     """Test volume down."""
@@ -124,6 +141,7 @@ async def test_media_player_volume_down(setup_integration, mock_client, hass: Ho
     await entity.async_volume_down()
     mock_client.set_volume.assert_called()
 
+
 @pytest.mark.asyncio
 async def test_media_player_set_volume(setup_integration, mock_client, hass: HomeAssistant):
     """Test setting volume."""
@@ -132,6 +150,7 @@ async def test_media_player_set_volume(setup_integration, mock_client, hass: Hom
     await entity.async_set_volume_level(0.7)
     mock_client.set_volume.assert_called_with(0.7)
 
+
 @pytest.mark.asyncio
 async def test_media_player_mute(setup_integration, mock_client, hass: HomeAssistant):
     """Test muting."""
@@ -140,6 +159,7 @@ async def test_media_player_mute(setup_integration, mock_client, hass: HomeAssis
     await entity.async_mute_volume(True)
     mock_client.set_mute.assert_called_with(True)
 
+
 @pytest.mark.asyncio
 async def test_media_player_supported_features(setup_integration, mock_client, hass: HomeAssistant):
     """Test supported features."""
@@ -155,6 +175,7 @@ async def test_media_player_supported_features(setup_integration, mock_client, h
     assert features & MediaPlayerEntityFeature.VOLUME_MUTE
     assert features & MediaPlayerEntityFeature.GROUPING
 
+
 @pytest.mark.asyncio
 async def test_media_player_source_list(setup_integration, mock_client, hass: HomeAssistant):
     """Test source list."""
@@ -164,4 +185,150 @@ async def test_media_player_source_list(setup_integration, mock_client, hass: Ho
     assert "WiFi" in sources
     assert "Line In" in sources
     assert "Bluetooth" in sources
-    assert "Optical" in sources
\ No newline at end of file
+    assert "Optical" in sources
+
+
+@pytest.mark.asyncio
+async def test_coordinator_ip_index(setup_integration, mock_client, hass: HomeAssistant):
+    """Coordinators are indexed by host for O(1) cross-device lookups."""
+    coordinator = setup_integration.runtime_data
+    assert hass.data[DATA_COORDINATORS_BY_IP][mock_client.host] is coordinator
+
+    await hass.config_entries.async_unload(setup_integration.entry_id)
+    await hass.async_block_till_done()
+    assert mock_client.host not in hass.data[DATA_COORDINATORS_BY_IP]
+
+
+@pytest.mark.asyncio
+async def test_group_volume_and_mute_metrics(hass: HomeAssistant):
+    """Group volume/mute come from one walk over members, redone on new data."""
+    master, slave = MagicMock(), MagicMock()
+    master.data = {"status": {"volume": 30, "mute": True}}
+    slave.data = {"status": {"volume": 70, "mute": False}}
+    master.get_group_by_master.return_value = {
+        "name": "Living Room",
+        "members": {"10.0.0.1": {}, "10.0.0.2": {}},
+    }
+    hass.data[DATA_COORDINATORS_BY_IP] = {"10.0.0.1": master, "10.0.0.2": slave}
+
+    group = WiiMGroupMediaPlayer(hass, master, "10.0.0.1")
+    assert group.volume_level == 0.7
+    assert group.is_volume_muted is False
+
+    slave.data = {"status": {"volume": 20, "mute": True}}
+    assert group.volume_level == 0.3
+    assert group.is_volume_muted is True
+
+
+@pytest.mark.asyncio
+async def test_entity_id_index(setup_integration, mock_client, hass: HomeAssistant):
+    """Media players are indexed by entity_id while added to HA."""
+    coordinator = setup_integration.runtime_data
+    index = hass.data[DATA_COORDINATORS_BY_ENTITY_ID]
+    entity_id = next(eid for eid, coord in index.items() if coord is coordinator)
+    assert _find_coordinator(hass, entity_id) is coordinator
+
+    await hass.config_entries.async_unload(setup_integration.entry_id)
+    await hass.async_block_till_done()
+    assert entity_id not in index
+
+
+@pytest.mark.asyncio
+async def test_media_player_shuffle_repeat(hass: HomeAssistant, mock_client):
+    """Shuffle/repeat are decoded from the single play_mode field."""
+    entity = _make_entity(hass, mock_client)
+    status = entity.coordinator.data["status"]
+    for mode, expected in (
+        ("shuffle_repeat_all", (True, "all")),
+        ("repeat_one", (False, "one")),
+        ("shuffle", (True, "off")),
+        ("normal", (False, "off")),
+    ):
+        status["play_mode"] = mode
+        assert (entity.shuffle, entity.repeat) == expected
+
+
+@pytest.mark.asyncio
+async def test_media_player_optimistic_volume(hass: HomeAssistant, mock_client):
+    """Volume/mute/repeat commands publish the expected state without a poll."""
+    entity = _make_entity(hass, mock_client)
+    mock_client.set_volume = AsyncMock()
+    mock_client.set_mute = AsyncMock()
+    mock_client.set_repeat_mode = AsyncMock()
+
+    await entity.async_set_volume_level(0.7)
+    await entity.async_mute_volume(True)
+    await entity.async_set_repeat("one")
+
+    assert entity.volume_level == 0.7
+    assert entity.is_volume_muted is True
+    assert entity.repeat == "one"
+    mock_client.set_repeat_mode.assert_awaited_once_with("repeat_one")
+    entity.coordinator.async_request_refresh.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_media_player_volume_up_from_zero(hass: HomeAssistant, mock_client):
+    """Volume up still works when the speaker is at volume 0."""
+    entity = _make_entity(hass, mock_client)
+    entity.coordinator.data["status"]["volume"] = 0
+    mock_client.set_volume = AsyncMock()
+    await entity.async_volume_up()
+    mock_client.set_volume.assert_awaited_once_with(0.05)
+
+
+@pytest.mark.asyncio
+async def test_group_command_reports_failed_members(hass: HomeAssistant):
+    """A group command reaches every member and names the ones that failed."""
+    master, slave = MagicMock(), MagicMock()
+    master.get_group_by_master.return_value = {
+        "name": "Living Room",
+        "members": {"10.0.0.1": {}, "10.0.0.2": {}},
+    }
+    master.client.play = AsyncMock()
+    slave.client.play = AsyncMock(side_effect=WiiMError("offline"))
+    hass.data[DATA_COORDINATORS_BY_IP] = {"10.0.0.1": master, "10.0.0.2": slave}
+
+    group = WiiMGroupMediaPlayer(hass, master, "10.0.0.1")
+    with pytest.raises(HomeAssistantError, match="10.0.0.2"):
+        await group.async_media_play()
+    master.client.play.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_group_mute_publishes_state_after_partial_failure(hass: HomeAssistant):
+    """Members that did mute are refreshed and shown even if another failed."""
+    master, slave = MagicMock(), MagicMock()
+    master.get_group_by_master.return_value = {
+        "name": "Living Room",
+        "members": {"10.0.0.1": {}, "10.0.0.2": {}},
+    }
+    master.client.set_mute = AsyncMock()
+    master.async_request_refresh = AsyncMock()
+    slave.client.set_mute = AsyncMock(side_effect=WiiMError("offline"))
+    slave.async_request_refresh = AsyncMock()
+    hass.data[DATA_COORDINATORS_BY_IP] = {"10.0.0.1": master, "10.0.0.2": slave}
+
+    group = WiiMGroupMediaPlayer(hass, master, "10.0.0.1")
+    group.async_write_ha_state = MagicMock()
+    with pytest.raises(HomeAssistantError, match="10.0.0.2"):
+        await group.async_mute_volume(True)
+    master.async_request_refresh.assert_awaited_once()
+    group.async_write_ha_state.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_group_sees_optimistic_member_volume(hass: HomeAssistant, mock_client):
+    """An optimistic volume change on a member shows up in the group entity."""
+    entity = _make_entity(hass, mock_client)
+    coordinator = entity.coordinator
+    coordinator.get_group_by_master = MagicMock(
+        return_value={"name": "Living Room", "members": {mock_client.host: {}}}
+    )
+    hass.data[DATA_COORDINATORS_BY_IP] = {mock_client.host: coordinator}
+    mock_client.set_volume = AsyncMock()
+
+    group = WiiMGroupMediaPlayer(hass, coordinator, mock_client.host)
+    assert group.volume_level == 0.5
+    await entity.async_set_volume_level(0.7)
+    assert group.volume_level == 0.7